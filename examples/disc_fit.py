@@ -1,16 +1,19 @@
-import os
 import pickle
+import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, NamedTuple, Tuple
 
-os.environ["OMP_NUM_THREADS"] = "1"
-os.environ["OPENBLAS_NUM_THREADS"] = "1"
-os.environ["MKL_NUM_THREADS"] = "1"
-os.environ["VECLIB_MAXIMUM_THREADS"] = "1"
-os.environ["NUMEXPR_NUM_THREADS"] = "1"
+from ppdmod.threads import set_thread_limits
+
+# NOTE: Set the variables beforehand for hybrid parallelism,
+# e.g., 'OMP_NUM_THREADS=4 mpiexec -n <nranks> python ...'
+set_thread_limits()
 
 import astropy.units as u
 import numpy as np
+import pandas as pd
 
 from ppdmod.basic_components import AsymGreyBody, GreyBody, Star
 from ppdmod.data import set_data
@@ -20,6 +23,7 @@ from ppdmod.fitting import (
     get_labels,
     run_fit,
     set_components_from_theta,
+    set_fit_cache,
 )
 from ppdmod.options import OPTIONS
 from ppdmod.parameter import Parameter
@@ -32,6 +36,54 @@ from ppdmod.utils import (
 
 
 DATA_DIR = Path(__file__).parent.parent / "data"
+SOURCE_DIR = DATA_DIR / "results" / "hd142527"
+
+
+class FitInputs(NamedTuple):
+    """The (read-only) input data of the fit."""
+
+    flux_star: Tuple[np.ndarray, np.ndarray]
+    kappa_abs: Tuple[np.ndarray, np.ndarray]
+    kappa_cont: Tuple[np.ndarray, np.ndarray]
+    temps: Any
+
+
+@lru_cache(maxsize=None)
+def load_inputs(data_dir: Path, source_dir: Path, method: str = "grf") -> FitInputs:
+    """Loads the input data of the fit once per process.
+
+    Notes
+    -----
+    The (.npy)-files are memory mapped, so that the pages are shared
+    between the (forked) workers instead of being copied into each.
+    """
+    flux_star = pd.read_csv(
+        data_dir / "flux" / "hd142527" / "HD142527_stellar_model.txt",
+        sep=r"\s+",
+        header=None,
+        comment="#",
+        usecols=[0, 2],
+        dtype=np.float64,
+        engine="c",
+    ).to_numpy().T
+    # NOTE: The rows of a memory mapped C-ordered array are contiguous views, so
+    # this does not copy (only a transposed or strided file would be)
+    kappa_abs = tuple(
+        map(
+            np.ascontiguousarray,
+            np.load(source_dir / f"silicate_{method}_opacities.npy", mmap_mode="r"),
+        )
+    )
+    kappa_cont = load_data(
+        data_dir / "opacities" / "qval" / "Q_amorph_c_rv0.1.dat",
+        load_func=qval_to_opacity,
+    )
+    with open(source_dir / "opacity_temps.pkl", "rb") as save_file:
+        temps = pickle.load(save_file)
+
+    return FitInputs(tuple(flux_star), kappa_abs, tuple(kappa_cont), temps)
+
+
 nband_wavelengths, nband_binning_windows = create_adaptive_bins([8.6, 12.3], [9.2, 11.9], 0.2, 0.65)
 wavelengths = {
     "hband": [1.7] * u.um,
@@ -52,28 +104,18 @@ data = set_data(
     fit_data=fit_data,
 )
 
-grid, value = np.loadtxt(
-    DATA_DIR / "flux" / "hd142527" / "HD142527_stellar_model.txt",
-    usecols=(0, 2),
-    unpack=True,
-)
+inputs = load_inputs(DATA_DIR, SOURCE_DIR, method="grf")
+grid, value = inputs.flux_star
 flux_star = Parameter(grid=grid, value=value, base="f")
 
-SOURCE_DIR = DATA_DIR / "results" / "hd142527"
-
-method = "grf"
-grid, value = np.load(SOURCE_DIR / f"silicate_{method}_opacities.npy")
+grid, value = inputs.kappa_abs
 kappa_abs = Parameter(grid=grid, value=value, base="kappa_abs")
 
-grid, value = load_data(
-    DATA_DIR / "opacities" / "qval" / "Q_amorph_c_rv0.1.dat", load_func=qval_to_opacity
-)
+grid, value = inputs.kappa_cont
 kappa_cont = Parameter(grid=grid, value=value, base="kappa_cont")
 pa = Parameter(value=352, free=False, shared=True, base="pa")
 cinc = Parameter(value=0.84, free=True, shared=True, base="cinc")
-
-with open(SOURCE_DIR / "opacity_temps.pkl", "rb") as save_file:
-    temps = pickle.load(save_file)
+temps = inputs.temps
 
 x = Parameter(free=True, base="x")
 y = Parameter(free=True, base="y")
@@ -136,12 +178,13 @@ outer_ring = AsymGreyBody(
 )
 
 OPTIONS.model.components = components = [star, inner_ring, outer_ring]
+now = datetime.now()
 DIR_NAME = "both_asym_inc_free"
 if DIR_NAME is None:
-    DIR_NAME = f"results_model_{datetime.now().strftime('%H:%M:%S')}"
+    DIR_NAME = f"results_model_{now.strftime('%H:%M:%S')}"
 
 result_dir = DATA_DIR.parent / "results" / "disc_fit"
-day_dir = Path(str(datetime.now().date()))
+day_dir = Path(str(now.date()))
 result_dir /= day_dir / DIR_NAME
 result_dir.mkdir(parents=True, exist_ok=True)
 
@@ -154,17 +197,56 @@ if __name__ == "__main__":
         map(labels.index, (filter(lambda x: "rin" in x or "rout" in x, labels)))
     )
     # fit_params = {"discard": 1000, "nsteps": 10000, "nwalkers": 60}
-    fit_params = {"dlogz_init": 0.01, "nlive_init": 1000, "nlive_batch": 100}
+    # NOTE: The batches are allocated fully to the posterior ("pfrac": 1.0),
+    # which converges faster on the parameters at the cost of a less precise evidence.
+    # Run with '--resume' to continue from the checkpoint of the same day, only if
+    # the model, the priors and the data are unchanged
+    fit_params = {
+        "dlogz_init": 0.01,
+        "nlive_init": 500,
+        "nlive_batch": 250,
+        "wt_kwargs": {"pfrac": 1.0},
+        "checkpoint_every": 600,
+        "resume": "--resume" in sys.argv,
+    }
     ncores = fit_params.get("nwalkers", 100) // 2
-    sampler = run_fit(**fit_params, ncores=ncores, save_dir=result_dir, debug=False)
+
+    # NOTE: Run with 'mpiexec -n <ncores> python disc_fit.py --mpi' to distribute
+    # the likelihood evaluations over MPI instead of a multiprocessing.Pool.
+    # The ranks are then pinned to cores by the MPI launcher (e.g., '--bind-to core')
+    if "--mpi" in sys.argv:
+        from schwimmbad import MPIPool
+
+        # NOTE: The workers never call run_fit, so the fit's cache is set on all ranks
+        set_fit_cache()
+        with MPIPool() as pool:
+            if not pool.is_master():
+                pool.wait()
+                sys.exit(0)
+
+            sampler = run_fit(
+                **fit_params, pool=pool, queue_size=pool.size, save_dir=result_dir
+            )
+    else:
+        sampler = run_fit(
+            **fit_params,
+            ncores=ncores,
+            pin_workers=True,
+            save_dir=result_dir,
+            debug=False,
+        )
+
     theta, uncertainties = get_best_fit(sampler, discard=fit_params.get("discard", 0))
     components = OPTIONS.model.components = set_components_from_theta(theta)
     np.save(result_dir / "theta.npy", theta)
     np.save(result_dir / "uncertainties.npy", uncertainties)
 
     with open(result_dir / "components.pkl", "wb") as file:
-        pickle.dump(components, file)
+        pickle.dump(components, file, protocol=pickle.HIGHEST_PROTOCOL)
 
+    # NOTE: The fit runs in single precision (OPTIONS.data.dtype),
+    # the final chi_sq is evaluated in double precision
+    OPTIONS.data.dtype.real, OPTIONS.data.dtype.complex = np.float64, np.complex128
     rchi_sq = compute_interferometric_chi_sq(
         components,
         theta.size,
@@ -3,17 +3,16 @@ import pickle
 from datetime import datetime
 from pathlib import Path
 
-from ppdmod.basic_components import NBandFit
+from ppdmod.threads import set_thread_limits
 
-os.environ["OMP_NUM_THREADS"] = "1"
-os.environ["OPENBLAS_NUM_THREADS"] = "1"
-os.environ["MKL_NUM_THREADS"] = "1"
-os.environ["VECLIB_MAXIMUM_THREADS"] = "1"
-os.environ["NUMEXPR_NUM_THREADS"] = "1"
+# NOTE: Set the variables beforehand for hybrid parallelism,
+# e.g., 'OMP_NUM_THREADS=4 mpiexec -n <nranks> python ...'
+set_thread_limits()
 
 import astropy.units as u
 import numpy as np
 
+from ppdmod.basic_components import NBandFit
 from ppdmod.data import set_data
 from ppdmod.fitting import (
     compute_nband_fit_chi_sq,
@@ -114,31 +113,44 @@ OPTIONS.model.components = components = [nband_fit]
 LABELS = get_labels(components)
 
 result_dir = Path("../model_results/") / "nband_fit"
-day_dir = result_dir / str(datetime.now().date())
-dir_name = f"results_model_{datetime.now().strftime('%H:%M:%S')}"
+now = datetime.now()
+day_dir = result_dir / str(now.date())
+dir_name = f"results_model_{now.strftime('%H:%M:%S')}"
 result_dir = day_dir / dir_name
 result_dir.mkdir(parents=True, exist_ok=True)
 
 ndim = len(LABELS)
-rchi_sq = compute_nband_fit_chi_sq(
-    components[0].compute_flux(OPTIONS.fit.wavelengths),
-    ndim=ndim,
-    method="linear",
-    reduced=True,
-)
-print(f"rchi_sq: {rchi_sq:.2f}")
 
 
 if __name__ == "__main__":
+    # NOTE: Set 'PPDMOD_PRINT_PREFIT' to print the chi_sq of the initial model
+    if os.environ.get("PPDMOD_PRINT_PREFIT"):
+        rchi_sq = compute_nband_fit_chi_sq(
+            components[0].compute_flux(OPTIONS.fit.wavelengths),
+            ndim=ndim,
+            method="linear",
+            reduced=True,
+        )
+        print(f"rchi_sq: {rchi_sq:.2f}")
+
     ncores = 50
-    fit_params = {"nlive_init": 2000, "batch_size": 1000, "lnprob": lnprob_nband_fit, "ptform": ptform}
+    # NOTE: The batches are allocated fully to the posterior ("pfrac": 1.0),
+    # which converges faster on the parameters at the cost of a less precise evidence
+    fit_params = {
+        "nlive_init": 500,
+        "nlive_batch": 250,
+        "wt_kwargs": {"pfrac": 1.0},
+        "checkpoint_every": 600,
+        "lnprob": lnprob_nband_fit,
+        "ptform": ptform,
+    }
     sampler = run_fit(**fit_params, ncores=ncores, save_dir=result_dir, debug=False)
 
     theta, uncertainties = get_best_fit(sampler)
     components = set_components_from_theta(theta)
 
     with open(result_dir / "components.pkl", "wb") as file:
-        pickle.dump(components, file)
+        pickle.dump(components, file, protocol=pickle.HIGHEST_PROTOCOL)
 
     rchi_sq = compute_nband_fit_chi_sq(
         components[0].compute_flux(OPTIONS.fit.wavelengths),
@@ -3,11 +3,11 @@ import pickle
 from datetime import datetime
 from pathlib import Path
 
-os.environ["OMP_NUM_THREADS"] = "1"
-os.environ["OPENBLAS_NUM_THREADS"] = "1"
-os.environ["MKL_NUM_THREADS"] = "1"
-os.environ["VECLIB_MAXIMUM_THREADS"] = "1"
-os.environ["NUMEXPR_NUM_THREADS"] = "1"
+from ppdmod.threads import set_thread_limits
+
+# NOTE: Set the variables beforehand for hybrid parallelism,
+# e.g., 'OMP_NUM_THREADS=4 mpiexec -n <nranks> python ...'
+set_thread_limits()
 
 import astropy.units as u
 import numpy as np
@@ -63,24 +63,35 @@ OPTIONS.model.components = components = [ring]
 LABELS = get_labels(components)
 
 result_dir = Path("../model_results/") / "ring_fit"
-day_dir = result_dir / str(datetime.now().date())
-dir_name = f"results_model_{datetime.now().strftime('%H:%M:%S')}"
+now = datetime.now()
+day_dir = result_dir / str(now.date())
+dir_name = f"results_model_{now.strftime('%H:%M:%S')}"
 result_dir = day_dir / dir_name
 result_dir.mkdir(parents=True, exist_ok=True)
 
 ndim = len(LABELS)
-rchi_sqs = compute_interferometric_chi_sq(
-    *compute_observables(components),
-    ndim=ndim,
-    method="linear",
-    reduced=True,
-)
-print(f"rchi_sq: {rchi_sqs[0]:.2f}")
 
 
 if __name__ == "__main__":
+    # NOTE: Set 'PPDMOD_PRINT_PREFIT' to print the chi_sq of the initial model
+    if os.environ.get("PPDMOD_PRINT_PREFIT"):
+        rchi_sqs = compute_interferometric_chi_sq(
+            *compute_observables(components),
+            ndim=ndim,
+            method="linear",
+            reduced=True,
+        )
+        print(f"rchi_sq: {rchi_sqs[0]:.2f}")
+
     ncores = 50
-    fit_params = {"nlive_init": 2000, "batch_size": 1000}
+    # NOTE: The batches are allocated fully to the posterior ("pfrac": 1.0),
+    # which converges faster on the parameters at the cost of a less precise evidence
+    fit_params = {
+        "nlive_init": 500,
+        "nlive_batch": 250,
+        "wt_kwargs": {"pfrac": 1.0},
+        "checkpoint_every": 600,
+    }
     sampler = run_fit(ncores=ncores, save_dir=result_dir, debug=False, **fit_params)
 
     theta, uncertainties = get_best_fit(sampler)
@@ -88,7 +99,7 @@ if __name__ == "__main__":
     np.save(result_dir / "uncertainties.npy", uncertainties)
 
     with open(result_dir / "components.pkl", "wb") as file:
-        pickle.dump(components, file)
+        pickle.dump(components, file, protocol=pickle.HIGHEST_PROTOCOL)
 
     rchi_sqs = compute_interferometric_chi_sq(
         *compute_observables(components),
@@ -1,15 +1,19 @@
-from functools import partial
-
 import astropy.units as u
 import numpy as np
-from astropy.modeling.models import BlackBody
 from scipy.interpolate import interp1d
 from scipy.special import j0, jv
 
 from .component import Component, FourierComponent
 from .options import OPTIONS
 from .parameter import Parameter
-from .utils import angular_to_distance, distance_to_angular, compare_angles
+from .utils import (
+    angular_to_distance,
+    compute_planck,
+    distance_to_angular,
+)
+
+SPECTRAL_FLUX_TO_JY = (u.erg / (u.cm**2 * u.s * u.Hz)).to(u.Jy)
+SPECTRAL_RADIANCE = u.erg / (u.cm**2 * u.s * u.Hz * u.sr)
 
 
 class NBandFit(Component):
@@ -51,7 +55,10 @@ class NBandFit(Component):
 
     def flux_func(self, wavelength: u.um) -> np.ndarray:
         """Returns the flux weight of the point source."""
-        bb = BlackBody(temperature=self.tempc())(wavelength)
+        bb = (
+            compute_planck(self.tempc().to_value(u.K), wavelength.to_value(u.um))
+            * SPECTRAL_RADIANCE
+        )
 
         # NOTE: The 1e2 term is to be able to fit the weights as percentages
         opacity = np.sum(
@@ -110,16 +117,16 @@ class Star(FourierComponent):
     def flux_func(self, wavelength: u.um) -> np.ndarray:
         """Computes the flux of the star."""
         if np.any(self.f.value != 0):
-            stellar_flux = self.f(wavelength)
+            stellar_flux = self.f.raw_call(wavelength.value)
         else:
-            plancks_law = BlackBody(temperature=self.eff_temp())
-            spectral_radiance = plancks_law(wavelength).to(
-                u.erg / (u.cm**2 * u.Hz * u.s * u.rad**2)
-            )
+            spectral_radiance = (
+                compute_planck(self.eff_temp().to_value(u.K), wavelength.to_value(u.um))
+                * SPECTRAL_RADIANCE
+            ).to(u.erg / (u.cm**2 * u.Hz * u.s * u.rad**2))
             stellar_flux = np.pi * (
                 spectral_radiance * self.stellar_radius_angular**2
-            ).to(u.Jy)
-        return stellar_flux.value.reshape((wavelength.size, 1))
+            ).to_value(u.Jy)
+        return stellar_flux.reshape((wavelength.size, 1))
 
     def vis_func(
         self, baselines: 1 / u.rad, baseline_angles: u.rad, wavelength: u.um, **kwargs
@@ -156,7 +163,7 @@ class Star(FourierComponent):
         -------
         image : astropy.units.Jy
         """
-        image = np.zeros((wavelength.size, *xx.shape))
+        image = np.zeros((wavelength.size, *xx.shape), dtype=OPTIONS.data.dtype.real)
         centre = xx.shape[0] // 2
         star_flux = (self.compute_flux(wavelength) / 4)[..., np.newaxis]
         image[:, centre - 1 : centre + 1, centre - 1 : centre + 1] = star_flux
@@ -187,6 +194,7 @@ class Ring(FourierComponent):
     name = "Ring"
     description = "A simple ring."
     thin, has_outer_radius = True, False
+    _grid_cache = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -213,11 +221,27 @@ class Ring(FourierComponent):
         """
         dx = self.rout() - self.rin() if self.has_outer_radius else self.width()
         rin, rout = self.rin().value, (self.rin() + dx).value
+
+        # NOTE: The grid only changes with the radii, its size and its type
+        key = (
+            np.ravel((rin, rout)).tolist(),
+            int(self.dim().value),
+            OPTIONS.model.gridtype,
+            OPTIONS.data.dtype.real,
+            self.rin.unit,
+        )
+        if self._grid_cache is not None and self._grid_cache[0] == key:
+            return self._grid_cache[1]
+
         if OPTIONS.model.gridtype == "linear":
             radius = np.linspace(rin, rout, self.dim())
         else:
             radius = np.logspace(np.log10(rin), np.log10(rout), self.dim())
-        return radius.astype(OPTIONS.data.dtype.real) * self.rin.unit
+
+        radius = radius.astype(OPTIONS.data.dtype.real) * self.rin.unit
+        radius.flags.writeable = False
+        self._grid_cache = (key, radius)
+        return radius
 
     def vis_func(
         self, baselines: 1 / u.rad, baseline_angles: u.rad, wavelength: u.um, **kwargs
@@ -235,62 +259,77 @@ class Ring(FourierComponent):
         brightness : astropy.unit.mas
             The radial brightness distribution
         """
-        mod_amps, cos_diff, bessel_funcs = [], [], []
+        orders = np.arange(1, OPTIONS.model.modulation + 1)
         if self.asymmetric:
-            for i in range(1, OPTIONS.model.modulation + 1):
-                rho, theta = getattr(self, f"rho{i}")(), getattr(self, f"theta{i}")()
-                mod_amps.append((-1j) ** i * rho)
-                cos_diff.append(np.cos(i * compare_angles(baseline_angles, theta)))
-                bessel_funcs.append(partial(jv, i))
+            rho = np.array([getattr(self, f"rho{i}")(raw=True) for i in orders])
+            theta = np.array(
+                [getattr(self, f"theta{i}")().to_value(u.rad) for i in orders]
+            )
+            mod_amps = (-1j) ** orders * rho
+
+            # NOTE: The modulation of all orders is computed at once. The angle difference
+            # needs no wrapping, as the cosine of its integer multiples is periodic
+            baseline_angles = baseline_angles.to_value(u.rad)
+            order_shape = (orders.size,) + (1,) * baseline_angles.ndim
+            cos_diff = np.cos(
+                orders.reshape(order_shape)
+                * (baseline_angles - theta.reshape(order_shape))
+            )
 
-            mod_amps = np.array(mod_amps)
-            cos_diff = np.array(cos_diff)
-            bessel_funcs = np.array(bessel_funcs)
+        dtype = OPTIONS.data.dtype.real
 
         def _vis_func(xx: np.ndarray):
             """Shorthand for the vis calculation."""
-            nonlocal mod_amps, cos_diff, bessel_funcs
-
-            vis = j0(xx).astype(complex)
+            # NOTE: The Bessel functions are evaluated in the model's precision
+            xx = xx.astype(dtype, copy=False)
+            vis = j0(xx).astype(OPTIONS.data.dtype.complex)
             if self.asymmetric:
-                bessel_funcs = np.array(list(map(lambda x: x(xx), bessel_funcs)))
-                mod_amps = mod_amps.reshape(
-                    (mod_amps.shape[0],) + (1,) * (bessel_funcs.ndim - 1)
-                )
-                vis += (mod_amps * cos_diff * bessel_funcs).sum(axis=0)
+                # NOTE: The Bessel functions of all orders are evaluated in one call
+                order_shape = (orders.size,) + (1,) * xx.ndim
+                bessel_funcs = jv(orders.astype(dtype).reshape(order_shape), xx)
+                amps = mod_amps.reshape(order_shape)
+                vis += (amps * cos_diff * bessel_funcs).sum(axis=0)
             return vis
 
+        # NOTE: The transform is done on the raw arrays (radius in rad, baselines
+        # in 1/rad, intensity in erg/(rad2 cm2 s Hz)), the units are only converted once
+        baselines = baselines.to_value(1 / u.rad).astype(dtype, copy=False)
         if self.thin:
-            vis = _vis_func(2 * np.pi * self.rin().to(u.rad) * baselines)
+            vis = _vis_func(2 * np.pi * self.rin().to_value(u.rad) * baselines)
         else:
             intensity_func = kwargs.pop("intensity_func", None)
             radius = self.compute_internal_grid()
 
             if intensity_func is not None:
-                intensity = intensity_func(radius, wavelength).to(
+                intensity = intensity_func(radius, wavelength).to_value(
                     u.erg / (u.rad**2 * u.cm**2 * u.s * u.Hz)
                 )
-                intensity = intensity[:, np.newaxis]
+                intensity = intensity.astype(dtype, copy=False)
 
             if radius.unit not in [u.rad, u.mas]:
                 radius = distance_to_angular(radius, self.dist())
 
-            radius = radius.to(u.rad)
+            radius = radius.to_value(u.rad).astype(dtype, copy=False)
             vis = _vis_func(2 * np.pi * radius * baselines)
-            if intensity_func is None:
-                vis = np.trapezoid(vis, radius)
-            else:
-                vis = np.trapezoid(radius * intensity * vis, radius).to(u.Jy)
 
+            # NOTE: The trapezoidal rule is applied as a matrix product with its
+            # weights, so the radial integration for all baselines is one (batched) GEMM
+            weights = np.zeros_like(radius)
+            half_steps = np.diff(radius) / 2
+            weights[:-1] += half_steps
+            weights[1:] += half_steps
             if intensity_func is None:
+                vis = vis @ weights
                 if self.has_outer_radius:
-                    vis /= (self.rout() - self.rin()).to(u.rad)
+                    vis /= (self.rout() - self.rin()).to_value(u.rad)
                 else:
-                    vis /= self.width().to(u.rad)
+                    vis /= self.width().to_value(u.rad)
             else:
-                vis *= 2 * np.pi * self.cinc()
+                weights = (radius * weights * intensity)[..., np.newaxis]
+                vis = (vis @ weights)[..., 0]
+                vis *= 2 * np.pi * self.cinc(raw=True) * SPECTRAL_FLUX_TO_JY
 
-        return vis.value.astype(OPTIONS.data.dtype.complex)
+        return vis.astype(OPTIONS.data.dtype.complex)
 
     def image_func(
         self, xx: u.mas, yy: u.mas, pixel_size: u.mas, wavelength: u.um, **kwargs
@@ -316,30 +355,45 @@ class Ring(FourierComponent):
         if not self.thin:
             dx = self.rout() - self.rin() if self.has_outer_radius else self.width()
 
-        radial_profile = (radius >= self.rin()) & (radius <= (self.rin() + dx))
+        rin = self.rin().to_value(radius.unit)
+        rout = (self.rin() + dx).to_value(radius.unit)
+        radial_profile = (radius.value >= rin) & (radius.value <= rout)
+
+        # NOTE: The image is built on one raw array in place. The unit conversion
+        # of the intensity to Jy per pixel is folded into a single scalar factor
+        dtype = OPTIONS.data.dtype.real
         intensity_func = kwargs.pop("intensity_func", None)
         if intensity_func is None:
-            intensity = 1 / (2 * np.pi)
+            image = radial_profile.astype(dtype)
+            image *= 1 / (2 * np.pi)
         else:
-            intensity = (
-                intensity_func(radius, wavelength).to(
-                    u.erg / (u.cm**2 * u.rad**2 * u.s * u.Hz)
-                )
-                * pixel_size.to(u.rad) ** 2
+            intensity = intensity_func(radius, wavelength).to_value(
+                u.erg / (u.cm**2 * u.rad**2 * u.s * u.Hz)
+            )
+            image = np.multiply(
+                intensity,
+                pixel_size.to_value(u.rad) ** 2 * SPECTRAL_FLUX_TO_JY,
+                dtype=dtype,
             )
-            intensity = intensity.to(u.Jy)
+            image *= radial_profile
 
-        image = intensity * radial_profile
         if self.asymmetric:
-            polar_angle, modulations = np.arctan2(yy, xx), []
-            for i in range(1, OPTIONS.model.modulation + 1):
-                rho, theta = getattr(self, f"rho{i}")(), getattr(self, f"theta{i}")()
-                modulations.append(rho * np.cos(compare_angles(theta, i * polar_angle)))
+            orders = np.arange(1, OPTIONS.model.modulation + 1)
+            rho = np.array([getattr(self, f"rho{i}")(raw=True) for i in orders])
+            theta = np.array(
+                [getattr(self, f"theta{i}")().to_value(u.rad) for i in orders]
+            )
 
-            modulations = u.Quantity(modulations)
-            image = image * (1 + np.sum(modulations, axis=0))
+            # NOTE: The modulation of all orders is computed at once. As in the
+            # vis_func, the angle difference needs no wrapping inside the cosine
+            polar_angle = np.arctan2(yy.value, xx.to_value(yy.unit))
+            order_shape = (orders.size,) + (1,) * polar_angle.ndim
+            modulations = rho.reshape(order_shape) * np.cos(
+                theta.reshape(order_shape) - orders.reshape(order_shape) * polar_angle
+            )
+            image *= 1 + modulations.sum(axis=0)
 
-        return image.astype(OPTIONS.data.dtype.real)
+        return image if intensity_func is None else image * u.Jy
 
 
 class TempGradient(Ring):
@@ -407,45 +461,67 @@ class TempGradient(Ring):
 
         return opacity
 
-    def compute_temperature(self, radius: u.au) -> u.K:
-        """Computes a 1D-temperature profile."""
+    def _compute_temperature(self, radius: np.ndarray) -> np.ndarray:
+        """Computes a 1D-temperature profile [K] from the radius [au]."""
         if self.const_temperature:
             if self.matrix is not None:
                 interp_op_temps = interp1d(self.weights, self.matrix, axis=0)(
                     self.weight_cont().value / 1e2
                 )
-                temperature = np.interp(radius.value, self.radii, interp_op_temps) * u.K
+                temperature = np.interp(radius, self.radii, interp_op_temps)
             else:
                 temperature = (
-                    np.sqrt(self.eff_radius().to(u.au) / (2 * radius)) * self.eff_temp()
+                    np.sqrt(self.eff_radius().to_value(u.au) / (2 * radius))
+                    * self.eff_temp().to_value(u.K)
                 )
         else:
-            temperature = self.temp0() * (radius / self.r0()) ** self.q()
+            temperature = (
+                self.temp0().to_value(u.K)
+                * (radius / self.r0().to_value(u.au)) ** self.q().value
+            )
         return temperature.astype(OPTIONS.data.dtype.real)
 
-    def compute_surface_density(self, radius: u.au) -> u.one:
-        """Computes a 1D-surface density profile."""
-        surface_density = self.sigma0() * (radius / self.r0()) ** self.p()
+    def _compute_surface_density(self, radius: np.ndarray) -> np.ndarray:
+        """Computes a 1D-surface density profile [g/cm2] from the radius [au]."""
+        surface_density = (
+            self.sigma0().to_value(u.g / u.cm**2)
+            * (radius / self.r0().to_value(u.au)) ** self.p().value
+        )
         return surface_density.astype(OPTIONS.data.dtype.real)
 
-    def compute_optical_depth(self, radius: u.au, wavelength: u.um) -> u.one:
-        """Computes a 1D-optical depth profile."""
-        surface_density = self.compute_surface_density(radius)
-        optical_depth = surface_density * self.get_opacity(wavelength)
+    def _compute_optical_depth(
+        self, radius: np.ndarray, wavelength: u.um
+    ) -> np.ndarray:
+        """Computes a 1D-optical depth profile from the radius [au]."""
+        opacity = self.get_opacity(wavelength).to_value(u.cm**2 / u.g)
+        optical_depth = self._compute_surface_density(radius) * opacity
         return optical_depth.astype(OPTIONS.data.dtype.real)
 
-    def compute_emissivity(self, radius: u.au, wavelength: u.um) -> u.one:
-        """Computes a 1D-emissivity profile."""
-        if wavelength.shape == ():
-            wavelength.reshape((wavelength.size,))
-
+    def _compute_emissivity(self, radius: np.ndarray, wavelength: u.um) -> np.ndarray:
+        """Computes a 1D-emissivity profile from the radius [au]."""
         if self.optically_thick:
             return np.array([1])[:, np.newaxis]
 
-        optical_depth = self.compute_optical_depth(radius, wavelength)
-        emissivity = 1 - np.exp(-optical_depth / self.cinc())
+        optical_depth = self._compute_optical_depth(radius, wavelength)
+        emissivity = 1 - np.exp(-optical_depth / self.cinc().value)
         return emissivity.astype(OPTIONS.data.dtype.real)
 
+    def compute_temperature(self, radius: u.au) -> u.K:
+        """Computes a 1D-temperature profile."""
+        return self._compute_temperature(radius.to_value(u.au)) * u.K
+
+    def compute_surface_density(self, radius: u.au) -> u.g / u.cm**2:
+        """Computes a 1D-surface density profile."""
+        return self._compute_surface_density(radius.to_value(u.au)) * (u.g / u.cm**2)
+
+    def compute_optical_depth(self, radius: u.au, wavelength: u.um) -> u.one:
+        """Computes a 1D-optical depth profile."""
+        return self._compute_optical_depth(radius.to_value(u.au), wavelength) * u.one
+
+    def compute_emissivity(self, radius: u.au, wavelength: u.um) -> u.one:
+        """Computes a 1D-emissivity profile."""
+        return self._compute_emissivity(radius.to_value(u.au), wavelength) * u.one
+
     def compute_intensity(self, radius: u.au, wavelength: u.um) -> u.Jy:
         """Computes a 1D-brightness profile from a dust-surface density- and
         temperature profile.
@@ -459,10 +535,11 @@ class TempGradient(Ring):
         -------
         brightness_profile : astropy.units.Jy
         """
-        temperature = self.compute_temperature(radius)
-        emissivity = self.compute_emissivity(radius, wavelength)
-        intensity = BlackBody(temperature)(wavelength) * emissivity
-        return intensity.astype(OPTIONS.data.dtype.real)
+        radius = radius.to_value(u.au)
+        temperature = self._compute_temperature(radius)
+        emissivity = self._compute_emissivity(radius, wavelength)
+        intensity = compute_planck(temperature, wavelength.to_value(u.um)) * emissivity
+        return intensity.astype(OPTIONS.data.dtype.real) * SPECTRAL_RADIANCE
 
     def flux_func(self, wavelength: u.um) -> np.ndarray:
         """Computes the total flux from the hankel transformation."""
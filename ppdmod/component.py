@@ -1,5 +1,5 @@
 import copy
-from typing import Tuple
+from typing import Any, List, Tuple
 
 import astropy.units as u
 import numpy as np
@@ -15,6 +15,7 @@ class Component:
     name = "GenComp"
     label = None
     description = "This is base component are derived."
+    _vis_cache = None
 
     def __init__(self, **kwargs):
         """The class's constructor."""
@@ -34,6 +35,14 @@ class Component:
                     else:
                         setattr(self, key, value)
 
+    def __getstate__(self) -> dict:
+        """Gets the state for pickling and copying without the caches."""
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if not key.endswith("_cache")
+        }
+
     def copy(self) -> "Component":
         """Copies the component."""
         return copy.deepcopy(self)
@@ -151,20 +160,30 @@ class FourierComponent(Component):
         self, xx: u.mas, yy: u.mas
     ) -> Tuple[u.Quantity[u.mas], u.Quantity[u.mas]]:
         """Shifts the coordinates in image space according to an offset."""
-        xx, yy = map(lambda x: u.Quantity(value=x, unit=u.mas), [xx, yy])
-        xx, yy = xx - self.x(), yy - self.y()
-        return xx.astype(OPTIONS.data.dtype.real), yy.astype(OPTIONS.data.dtype.real)
+        xx = u.Quantity(xx, u.mas).value - self.x().to_value(u.mas)
+        yy = u.Quantity(yy, u.mas).value - self.y().to_value(u.mas)
+        return (
+            xx.astype(OPTIONS.data.dtype.real) * u.mas,
+            yy.astype(OPTIONS.data.dtype.real) * u.mas,
+        )
 
     # TODO: Check this again
     def translate_vis_func(
         self, baselines: 1 / u.rad, baseline_angles: u.rad
     ) -> np.ndarray:
         """Translates a coordinate shift in image space to Fourier space."""
-        uv_coords = np.exp(
-            (1j * self.x().to(u.rad) * np.cos(baseline_angles)).value
-        ) * np.exp((1j * self.y().to(u.rad) * np.sin(baseline_angles)).value)
-        translation = np.exp(2j * np.pi * baselines * np.angle(uv_coords) * u.rad)
-        return translation.value.astype(OPTIONS.data.dtype.complex)
+        x, y = self.x().to_value(u.rad), self.y().to_value(u.rad)
+        baselines = u.Quantity(baselines, 1 / u.rad).value
+        baseline_angles = u.Quantity(baseline_angles, u.rad).value
+        if x == 0 and y == 0:
+            shape = np.broadcast_shapes(baselines.shape, baseline_angles.shape)
+            return np.ones(shape, dtype=OPTIONS.data.dtype.complex)
+
+        phase = np.angle(
+            np.exp(1j * (x * np.cos(baseline_angles) + y * np.sin(baseline_angles)))
+        )
+        translation = np.exp(2j * np.pi * baselines * phase)
+        return translation.astype(OPTIONS.data.dtype.complex)
 
     def vis_func(
         self, baselines: 1 / u.rad, baseline_angles: u.rad, wavelength: u.um, **kwargs
@@ -172,10 +191,51 @@ class FourierComponent(Component):
         """Computes the correlated fluxes."""
         return np.array([]).astype(OPTIONS.data.dtype.complex)
 
+    def get_state(self) -> Tuple[Tuple, List[Any]]:
+        """Gets the state of the component's parameters and attributes.
+
+        Returns
+        -------
+        state : tuple
+            The state of the component (and the relevant model options).
+        objects : list
+            The attributes that are tracked by their identity.
+        """
+        state, objects = [], []
+        for key, value in vars(self).items():
+            if key.endswith("_cache"):
+                continue
+            if isinstance(value, Parameter):
+                state.append((key, value._state))
+            elif value is None or isinstance(value, (bool, int, float, str)):
+                state.append((key, value))
+            else:
+                state.append((key, id(value)))
+                objects.append(value)
+
+        options = (
+            OPTIONS.model.modulation,
+            OPTIONS.model.gridtype,
+            OPTIONS.data.dtype.real,
+            OPTIONS.data.dtype.complex,
+        )
+        return (options, tuple(state)), objects
+
     def compute_complex_vis(
         self, ucoord: u.m, vcoord: u.m, wavelength: u.um, **kwargs
     ) -> np.ndarray:
         """Computes the correlated fluxes."""
+        coords = [np.asarray(ucoord), np.asarray(vcoord), u.Quantity(wavelength)]
+        state, objects = self.get_state()
+        # NOTE: Reuses the last result while the state of the component is unchanged
+        if not kwargs and self._vis_cache is not None:
+            cached_state, _, cached_coords, cached_vis = self._vis_cache
+            if cached_state == state and all(
+                cached.shape == coord.shape and np.array_equal(cached, coord)
+                for cached, coord in zip(cached_coords, coords)
+            ):
+                return cached_vis.copy()
+
         baselines, baseline_angles = compute_effective_baselines(
             ucoord, vcoord, self.cinc(), self.pa()
         )
@@ -189,9 +249,13 @@ class FourierComponent(Component):
         shift = shift.reshape(shift.shape[:-1]) if shift.shape[-1] == 1 else shift
 
         if self.name != "Point":
-            vis *= self.fr()
+            vis *= self.fr(raw=True)
 
-        return (vis * shift).astype(OPTIONS.data.dtype.complex)
+        vis = (vis * shift).astype(OPTIONS.data.dtype.complex)
+        if not kwargs:
+            coords = [coord.copy() for coord in coords]
+            self._vis_cache = (state, objects, coords, vis.copy())
+        return vis
 
     def image_func(
         self, xx: u.mas, yy: u.mas, pixel_size: u.mas, wavelength: u.um
@@ -219,12 +283,16 @@ class FourierComponent(Component):
             else u.Quantity(pixel_size, u.mas)
         )
 
+        # NOTE: The translation is applied to the 1D axes. The rotation then
+        # broadcasts them onto the 2D grid, instead of working on a full meshgrid
         xx = np.linspace(-0.5, 0.5, dim) * pixel_size * dim
-        xx, yy = self.translate_image_func(*np.meshgrid(xx, xx))
+        xx, yy = self.translate_image_func(xx, xx)
+        xx, yy = xx[np.newaxis, :], yy[:, np.newaxis]
 
-        pa_rad = self.pa().to(u.rad)
-        xr = xx * np.cos(pa_rad) - yy * np.sin(pa_rad)
-        yr = xx * np.sin(pa_rad) + yy * np.cos(pa_rad)
+        pa_rad = self.pa().to_value(u.rad)
+        cos_pa, sin_pa = np.cos(pa_rad), np.sin(pa_rad)
+        xr = xx * cos_pa - yy * sin_pa
+        yr = xx * sin_pa + yy * cos_pa
         xx, yy = xr * (1 / self.cinc()), yr
 
         image = self.image_func(xx, yy, pixel_size, wavelength)
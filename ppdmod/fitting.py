@@ -1,8 +1,10 @@
-from multiprocessing import Pool
+import os
+from functools import lru_cache
+from multiprocessing import Pool, Value
+from multiprocessing.sharedctypes import Synchronized
 from pathlib import Path
 from typing import List, Tuple
 
-import astropy.units as u
 import dynesty.utils as dyutils
 import emcee
 import numpy as np
@@ -11,7 +13,8 @@ from dynesty import DynamicNestedSampler
 from .component import Component
 from .data import get_counts_data
 from .options import OPTIONS
-from .utils import compare_angles, compute_t3, compute_vis
+from .parameter import Parameter
+from .utils import compute_t3, compute_vis
 
 
 def get_fit_params(components: List[Component], key: str | None = None) -> np.ndarray:
@@ -80,11 +83,66 @@ def get_labels(components: List[Component]) -> np.ndarray:
     return labels
 
 
+@lru_cache(maxsize=None)
+def get_label_indices(labels: Tuple[str], substring: str) -> Tuple[int]:
+    """Gets the indices of the labels that contain a substring.
+
+    Parameters
+    ----------
+    labels : tuple of str
+        The labels of the fit parameters.
+    substring : str
+        The substring to search for.
+
+    Returns
+    -------
+    indices : tuple of int
+    """
+    return tuple(index for index, label in enumerate(labels) if substring in label)
+
+
 def get_priors(components: List[Component]) -> np.ndarray:
     """Gets the priors from the model parameters."""
     return np.array([param.get_limits() for param in get_fit_params(components)])
 
 
+def get_fit_priors() -> np.ndarray:
+    """Gets the priors of the model's components."""
+    if OPTIONS.fit.priors is not None:
+        return OPTIONS.fit.priors
+    return get_priors(OPTIONS.model.components)
+
+
+def get_fit_labels() -> Tuple[str]:
+    """Gets the labels of the model's components."""
+    if OPTIONS.fit.labels is not None:
+        return OPTIONS.fit.labels
+    return tuple(get_labels(OPTIONS.model.components))
+
+
+def get_fit_data(key: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Gets the unmasked data and errors of a dataset and their (flat) indices.
+
+    Parameters
+    ----------
+    key : str
+        The key of the dataset (e.g., "flux", "vis", "vis2" or "t3").
+
+    Returns
+    -------
+    value : numpy.ndarray
+    err : numpy.ndarray
+    indices : numpy.ndarray
+    """
+    if OPTIONS.fit.data_cache is not None:
+        return OPTIONS.fit.data_cache[key]
+
+    data = getattr(OPTIONS.data, key)
+    indices = np.flatnonzero(~np.ma.getmaskarray(data.value))
+    value = np.take(np.ma.getdata(data.value), indices)
+    return value, np.take(np.ma.getdata(data.err), indices), indices
+
+
 def get_units(components: List[Component]) -> np.ndarray:
     """Sets the units from the components."""
     return get_fit_params(components, "unit")
@@ -95,38 +153,56 @@ def get_theta(components: List[Component]) -> np.ndarray:
     return get_fit_params(components, "value")
 
 
-def set_components_from_theta(theta: np.ndarray) -> List[Component]:
-    """Sets the components from theta."""
-    components = [component.copy() for component in OPTIONS.model.components]
-    nshared = len(components[-1].get_params(free=True, shared=True))
-    if nshared != 0:
-        theta_list, shared_params = theta[:-nshared], theta[-nshared:]
-    else:
-        theta_list, shared_params = theta, []
+def get_theta_params(components: List[Component]) -> List[List[Parameter]]:
+    """Gets the parameters of the components that are set by each entry of theta.
 
-    theta_list = theta_list.copy().tolist()
-    shared_params_labels = [
-        label.split("-")[0] for label in get_labels(components) if "sh" in label
-    ]
+    The parameters are flagged as free (and shared) accordingly.
 
+    Parameters
+    ----------
+    components : list of Component
+        The components to be used in the model.
+
+    Returns
+    -------
+    theta_params : list of list of Parameter
+        For every entry of theta the parameters it is set to.
+    """
+    shared_params_labels = list(components[-1].get_params(free=True, shared=True))
+    theta_params, shared_params = [], [[] for _ in shared_params_labels]
     for component in components:
         for param in component.get_params(free=True).values():
-            param.value = theta_list.pop(0)
             param.free = True
+            theta_params.append([param])
 
-        for param_name, value in zip(shared_params_labels, shared_params):
+        for param_name, params in zip(shared_params_labels, shared_params):
             if hasattr(component, param_name):
                 param = getattr(component, param_name)
-                param.value = value
                 param.free = param.shared = True
+                params.append(param)
+
+    return theta_params + shared_params
+
+
+def set_components_from_theta(theta: np.ndarray) -> List[Component]:
+    """Sets the components from theta."""
+    if OPTIONS.fit.components is not None:
+        components, theta_params = OPTIONS.fit.components, OPTIONS.fit.theta_params
+    else:
+        components = [component.copy() for component in OPTIONS.model.components]
+        theta_params = get_theta_params(components)
+
+    for value, params in zip(np.asarray(theta).tolist(), theta_params, strict=True):
+        for param in params:
+            param.value = value
 
     return components
 
 
 def compute_chi_sq(
-    data: u.Quantity,
-    error: u.Quantity,
-    model_data: u.Quantity,
+    data: np.ndarray,
+    error: np.ndarray,
+    model_data: np.ndarray,
     diff_method: str = "linear",
     method: str = "logarithmic",
     lnf: float | None = None,
@@ -162,20 +238,28 @@ def compute_chi_sq(
 
     residuals = data - model_data
     if diff_method == "periodic":
-        residuals = np.rad2deg(compare_angles(np.deg2rad(data), np.deg2rad(model_data)))
-
-    chi_sq = residuals**2 / sn
+        # NOTE: Wraps the residuals of the angles (in degrees) into [-180, 180)
+        residuals += 180
+        np.remainder(residuals, 360, out=residuals)
+        residuals -= 180
+
+    # NOTE: The residuals are reused as the buffer for the chi square
+    residuals *= residuals
+    residuals /= sn
+    chi_sq = residuals.sum()
     if method == "linear":
-        return chi_sq.sum()
+        return chi_sq
 
-    chi_sq += np.log(sn) + data.size * np.log(2 * np.pi)
-    return -0.5 * np.sum(chi_sq)
+    # NOTE: The normalisation term 'data.size * log(2 pi)' is added for every data point
+    chi_sq += np.log(sn).sum() + data.size**2 * np.log(2 * np.pi)
+    return -0.5 * chi_sq
 
 
 def compute_observables(
     components: List[Component],
     wavelength: np.ndarray | None = None,
-) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    rcomponents: bool = False,
+) -> Tuple[np.ndarray, ...]:
     """Calculates the observables from the model.
 
     Parameters
@@ -184,28 +268,48 @@ def compute_observables(
         The components to be used in the model.
     wavelength : numpy.ndarray, optional
         The wavelength to be used in the model.
+    rcomponents : bool, optional
+        If toggled, the visibilities of the individual components are
+        returned as well (as the last element).
     """
     wavelength = OPTIONS.fit.wavelengths if wavelength is None else wavelength
     vis = OPTIONS.data.vis2 if "vis2" in OPTIONS.fit.data else OPTIONS.data.vis
     t3 = OPTIONS.data.t3
-    complex_vis = np.sum(
-        [
-            comp.compute_complex_vis(vis.ucoord, vis.vcoord, wavelength)
-            for comp in components
-        ],
-        axis=0,
-    )
-    complex_t3 = np.sum(
-        [
-            comp.compute_complex_vis(t3.ucoord, t3.vcoord, wavelength)
-            for comp in components
-        ],
-        axis=0,
-    )
+
+    # NOTE: The vis and t3 coordinates are stacked, so that the (intensity) profiles
+    # and the transforms of each component are computed once for both. The
+    # components are accumulated in place into one preallocated array
+    ucoord = np.concatenate((vis.ucoord, t3.ucoord), axis=-1)
+    vcoord = np.concatenate((vis.vcoord, t3.vcoord), axis=-1)
+    shape = (np.size(wavelength), ucoord.shape[-1])
+    if rcomponents:
+        complex_vis_comps = np.empty(
+            (len(components), *shape), dtype=OPTIONS.data.dtype.complex
+        )
+        for index, component in enumerate(components):
+            complex_vis_comps[index] = component.compute_complex_vis(
+                ucoord, vcoord, wavelength
+            )
+        complex_vis = complex_vis_comps.sum(axis=0)
+    else:
+        complex_vis = np.zeros(shape, dtype=OPTIONS.data.dtype.complex)
+        for component in components:
+            complex_vis += component.compute_complex_vis(ucoord, vcoord, wavelength)
+
+    nvis = vis.ucoord.shape[-1]
+    complex_vis, complex_t3 = complex_vis[:, :nvis], complex_vis[:, nvis:]
 
     t3_model = compute_t3(complex_t3[:, t3.index123])
     flux_model = complex_vis[:, 0].reshape(-1, 1)
 
+    if rcomponents:
+        complex_vis_comps = complex_vis_comps[..., 1:nvis]
+        if OPTIONS.model.output == "normed":
+            complex_vis_comps /= flux_model
+
+        if "vis2" in OPTIONS.fit.data:
+            complex_vis_comps *= complex_vis_comps
+
     if OPTIONS.model.output == "normed":
         complex_vis /= flux_model
 
@@ -214,8 +318,13 @@ def compute_observables(
 
     complex_vis = compute_vis(complex_vis[:, 1:])
     if flux_model.size > 0:
-        flux_model = np.tile(flux_model, OPTIONS.data.flux.value.shape[-1]).real
+        # NOTE: The flux is the same for all flux datasets, hence a (read-only) view
+        flux_model = np.broadcast_to(
+            flux_model.real, (flux_model.shape[0], OPTIONS.data.flux.value.shape[-1])
+        )
 
+    if rcomponents:
+        return flux_model, complex_vis, t3_model, compute_vis(complex_vis_comps)
     return flux_model, complex_vis, t3_model
 
 
@@ -246,17 +355,16 @@ def compute_nband_fit_chi_sq(
     """
     # NOTE: The -1 here indicates that one of the parameters is actually fixed
     ndim -= 1
-    flux = OPTIONS.data.flux
-    mask = flux.value.mask
+    value, err, indices = get_fit_data("flux")
     chi_sq = compute_chi_sq(
-        flux.value.data[~mask].astype(OPTIONS.data.dtype.real),
-        flux.err.data[~mask].astype(OPTIONS.data.dtype.real),
-        flux_model[~mask],
+        value.astype(OPTIONS.data.dtype.real),
+        err.astype(OPTIONS.data.dtype.real),
+        np.take(flux_model, indices),
         method=method,
     )
 
     if reduced:
-        return chi_sq / (flux.value.size - ndim)
+        return chi_sq / (OPTIONS.data.flux.value.size - ndim)
 
     return chi_sq
 
@@ -292,17 +400,16 @@ def compute_interferometric_chi_sq(
 
     chi_sqs = []
     for key in OPTIONS.fit.data:
-        data = getattr(OPTIONS.data, key)
+        value, err, indices = get_fit_data(key)
         key = key if key != "vis2" else "vis"
-        mask = data.value.mask
         chi_sqs.append(
             compute_chi_sq(
-                data.value.data[~mask],
-                data.err.data[~mask],
-                model_data[key][~mask],
+                value,
+                err,
+                np.take(model_data[key], indices),
                 diff_method="linear" if key != "t3" else "periodic",
                 method=method,
-                lnf=getattr(components[-1], f"{key}_lnf")(),
+                lnf=getattr(components[-1], f"{key}_lnf").value,
             )
         )
 
@@ -319,16 +426,31 @@ def compute_interferometric_chi_sq(
     return (total_chi_sq, *chi_sqs)
 
 
-def transform_uniform_prior(theta: List[float]) -> float:
-    """Prior transform for uniform priors."""
-    priors = get_priors(OPTIONS.model.components)
+def transform_uniform_prior(theta: np.ndarray) -> np.ndarray:
+    """Prior transform for uniform priors.
+
+    Parameters
+    ----------
+    theta : numpy.ndarray
+        The unit cube samples. Either a single sample of shape (ndim,)
+        or a batch of samples of shape (nsamples, ndim).
+
+    Returns
+    -------
+    params : numpy.ndarray
+        The transformed parameters in the same shape as theta.
+    """
+    priors = get_fit_priors()
     return priors[:, 0] + (priors[:, 1] - priors[:, 0]) * theta
 
 
 # TODO: Improve this and make it work again
-def ptform_nband_fit(theta: List[float]) -> np.ndarray:
+def ptform_nband_fit(theta: List[float], labels: List[str] | None = None) -> np.ndarray:
     """Transform that soft constrains successive radii to be smaller than the one before."""
-    indices = list(map(labels.index, filter(lambda x: "weight" in x, labels)))
+    if labels is None:
+        labels = get_fit_labels()
+
+    indices = get_label_indices(tuple(labels), "weight")
     params = transform_uniform_prior(theta)
 
     remainder = 100
@@ -341,7 +463,7 @@ def ptform_nband_fit(theta: List[float]) -> np.ndarray:
 
 
 # TODO: Improve this and make it work again
-def ptform_one_disc(theta: List[float]) -> np.ndarray:
+def ptform_one_disc(theta: List[float], labels: List[str] | None = None) -> np.ndarray:
     """Transform that hard constrains the model to one continous disc by
     setting the outer radius of the first component to the inner of the second.
 
@@ -351,8 +473,11 @@ def ptform_one_disc(theta: List[float]) -> np.ndarray:
     -----
     Only works with two components (as of now - could be extended).
     """
-    params = (transform_uniform_prior(theta),)
-    priors = get_priors(OPTIONS.model.components)
+    if labels is None:
+        labels = get_fit_labels()
+
+    params = transform_uniform_prior(theta)
+    priors = get_fit_priors()
     indices = OPTIONS.fit.condition_indices
     params[indices[2]] = params[indices[1]]
     params[indices[-1]] = (
@@ -361,8 +486,8 @@ def ptform_one_disc(theta: List[float]) -> np.ndarray:
     if params[indices[-2]] > priors[indices[-2]][1]:
         params[indices[-2]] = priors[indices[-2]][1]
 
-    indices_sigma0 = list(map(labels.index, filter(lambda x: "sigma0" in x, labels)))
-    indices_p = list(map(labels.index, filter(lambda x: "p" in x, labels)))
+    indices_sigma0 = get_label_indices(tuple(labels), "sigma0")
+    indices_p = get_label_indices(tuple(labels), "p")
     r0 = OPTIONS.model.reference_radius.value
     sigma01, p1, p2 = (
         params[indices_sigma0[0]],
@@ -375,20 +500,34 @@ def ptform_one_disc(theta: List[float]) -> np.ndarray:
 
 
 # TODO: Check this condition again
-def ptform_sequential_radii(theta: List[float]) -> np.ndarray:
-    """Transform that soft constrains successive radii to be smaller than the one before."""
-    priors = get_priors(OPTIONS.model.components)
-    params = transform_uniform_prior(theta)
+def ptform_sequential_radii(theta: np.ndarray) -> np.ndarray:
+    """Transform that soft constrains successive radii to be smaller than the one before.
+
+    Parameters
+    ----------
+    theta : numpy.ndarray
+        The unit cube samples. Either a single sample of shape (ndim,)
+        or a batch of samples of shape (nsamples, ndim).
+
+    Returns
+    -------
+    params : numpy.ndarray
+        The transformed parameters in the same shape as theta.
+    """
+    theta = np.asarray(theta)
+    priors = get_fit_priors()
+    params = priors[:, 0] + (priors[:, 1] - priors[:, 0]) * theta
     indices = OPTIONS.fit.condition_indices
 
-    new_radii = [params[indices][0]]
-    for index, (uniform, prior) in enumerate(
-        zip(theta[indices][1:], priors[indices][1:]), start=1
-    ):
-        prior[0] = new_radii[index - 1]
-        new_radii.append(prior[0] + (prior[1] - prior[0]) * uniform)
+    # NOTE: Each radius is drawn between the previous radius and its upper limit.
+    # The loop only runs over the radii, all samples are transformed at once
+    uniforms, upper_limits = theta[..., indices], priors[indices, 1]
+    radii = params[..., indices]
+    for index in range(1, upper_limits.size):
+        lower = radii[..., index - 1]
+        radii[..., index] = lower + (upper_limits[index] - lower) * uniforms[..., index]
 
-    params[indices] = new_radii
+    params[..., indices] = radii
     return params
 
 
@@ -417,12 +556,11 @@ def lnprob_nband_fit(theta: np.ndarray) -> float:
     )
 
 
-def lnprior(components: List[Component]) -> float:
+def lnprior(theta: np.ndarray) -> float:
     """Checks if the parameters are within the priors (for emcee)."""
-    theta, priors = get_theta(components), get_priors(components)
-    for param, prior in zip(theta, priors):
-        if not prior[0] <= param <= prior[1]:
-            return -np.inf
+    priors = get_fit_priors()
+    if not np.all((priors[:, 0] <= theta) & (theta <= priors[:, 1])):
+        return -np.inf
 
     if OPTIONS.fit.condition == "sequential_radii":
         indices = OPTIONS.fit.condition_indices
@@ -449,11 +587,11 @@ def lnprob(theta: np.ndarray) -> float:
     float
         The log of the probability.
     """
-    components = set_components_from_theta(theta)
     if OPTIONS.fit.fitter == "emcee":
-        if np.isinf(lnprior(components)):
+        if np.isinf(lnprior(theta)):
             return -np.inf
 
+    components = set_components_from_theta(theta)
     return compute_interferometric_chi_sq(
         components, ndim=theta.size, method="logarithmic"
     )[0]
@@ -469,31 +607,47 @@ def init_uniformly(nwalkers: int) -> np.ndarray:
     -------
     theta : numpy.ndarray
     """
-    priors = get_priors(OPTIONS.model.components)
-    uniform_grid = np.array(
-        [[np.random.uniform(0, 1) for _ in range(len(priors))] for _ in range(nwalkers)]
-    )
-    sample_grid = np.array(
-        [
-            prior[0] + (prior[1] - prior[0]) * uniform_grid[:, i]
-            for i, prior in enumerate(priors)
-        ]
-    ).T
-
+    uniform_grid = np.random.uniform(0, 1, size=(nwalkers, len(get_fit_priors())))
     if OPTIONS.fit.condition == "sequential_radii":
-        indices = OPTIONS.fit.condition_indices
-        for row_index, (value_row, uniform_row) in enumerate(
-            zip(sample_grid, uniform_grid)
-        ):
-            new_radii = [value_row[indices][0]]
-            for index, (uniform, prior) in enumerate(
-                zip(uniform_row[indices][1:], priors[indices][1:]), start=1
-            ):
-                prior[0] = new_radii[index - 1]
-                new_radii.append(prior[0] + (prior[1] - prior[0]) * uniform)
-            sample_grid[row_index, indices] = new_radii
+        return ptform_sequential_radii(uniform_grid)
+    return transform_uniform_prior(uniform_grid)
 
-    return sample_grid
+
+def pin_worker_to_core(counter: Synchronized) -> None:
+    """Pins the calling pool worker to the next free core.
+
+    Used as the initializer of the multiprocessing.Pool so that the workers
+    are not migrated between the (cache sharing) cores by the scheduler.
+    """
+    with counter.get_lock():
+        worker_index = counter.value
+        counter.value += 1
+
+    cores = sorted(os.sched_getaffinity(0))
+    os.sched_setaffinity(0, {cores[worker_index % len(cores)]})
+
+
+def create_pool(ncores: int, pin_workers: bool = False) -> Pool:
+    """Creates the multiprocessing pool for the samplers.
+
+    Parameters
+    ----------
+    ncores : int
+        The number of worker processes.
+    pin_workers : bool, optional
+        Whether to pin each worker to its own core. Only done on platforms
+        that support os.sched_setaffinity (Linux) and if there are at least
+        as many available cores as workers.
+    """
+    if (
+        pin_workers
+        and hasattr(os, "sched_setaffinity")
+        and ncores <= len(os.sched_getaffinity(0))
+    ):
+        return Pool(
+            processes=ncores, initializer=pin_worker_to_core, initargs=(Value("i", 0),)
+        )
+    return Pool(processes=ncores)
 
 
 def run_emcee(
@@ -517,33 +671,62 @@ def run_emcee(
     discard : int, optional
     ncores : int, optional
     debug : bool, optional
+    pool : optional
+        An externally managed pool (e.g., a schwimmbad.MPIPool) that is
+        used instead of creating a multiprocessing.Pool. It is not closed
+        after the run.
+    pin_workers : bool, optional
+        Whether to pin each worker of the created pool to a single core
+        (see create_pool).
+    moves : optional
+        The emcee move(s) of the sampler. Default is emcee's stretch move.
+    adaptive : bool, optional
+        If toggled (and nburnin > 0), a pilot run of nburnin steps is done first.
+        The production run then uses a Gaussian (adaptive Metropolis) move with
+        the covariance (2.38**2 / ndim) * cov of the second half of the pilot
+        chain, starting from its last position.
     Returns
     -------
     sampler : numpy.ndarray
     """
     init_guess = init_uniformly(nwalkers)
+    ndim = init_guess.shape[1]
+    lnprob_func, moves = kwargs.pop("lnprob", lnprob), kwargs.pop("moves", None)
+
+    pool = kwargs.pop("pool", None)
+    external_pool = pool is not None
+    pin_workers = kwargs.pop("pin_workers", False)
+    if pool is None and not debug:
+        pool = create_pool(ncores, pin_workers)
 
-    pool = Pool(processes=ncores) if not debug else None
     print(f"Executing MCMC.\n{'':-^50}")
+    if kwargs.pop("adaptive", False) and nburnin > 0:
+        pilot = emcee.EnsembleSampler(nwalkers, ndim, lnprob_func, pool=pool)
+        state = pilot.run_mcmc(init_guess, nburnin, progress=True)
+        cov = np.atleast_2d(np.cov(pilot.get_chain(discard=nburnin // 2, flat=True).T))
+        moves = emcee.moves.GaussianMove(2.38**2 / ndim * cov)
+        init_guess = state.coords
+
     if save_dir is not None:
         save_file = save_dir / "sampler.h5"
         store = True
         backend = emcee.backends.HDFBackend(str(save_file))
-        backend.reset(nwalkers, init_guess.shape[1])
+        backend.reset(nwalkers, ndim)
     else:
         store = False
         backend = None
 
     sampler = emcee.EnsembleSampler(
         nwalkers,
-        init_guess.shape[1],
-        kwargs.pop("lnprob", lnprob),
+        ndim,
+        lnprob_func,
         pool=pool,
+        moves=moves,
         backend=backend,
     )
     sampler.run_mcmc(init_guess, nsteps, progress=True, store=store)
 
-    if not debug:
+    if pool is not None and not external_pool:
         pool.close()
         pool.join()
 
@@ -573,15 +756,37 @@ def run_dynesty(
         This will not use multiprocessing.
     save_dir : Path, optional
         The directory to save the sampler.
+    pool : optional
+        An externally managed pool (e.g., a schwimmbad.MPIPool) that is
+        used instead of creating a multiprocessing.Pool. It is not closed
+        after the run.
+    pin_workers : bool, optional
+        Whether to pin each worker of the created pool to a single core
+        (see create_pool).
+    queue_size : int, optional
+        The number of parallel likelihood evaluations. Defaults to twice
+        the number of cores.
+    wt_kwargs : dict, optional
+        The weighting of the batches of the dynamic sampler. A "pfrac" of
+        1.0 allocates all batches to the posterior, 0.0 to the evidence.
+    checkpoint_file : Path, optional
+        The file the state of the sampler is periodically saved to.
+        Defaults to "sampler.save" in the save_dir.
+    checkpoint_every : float, optional
+        The time in seconds between two checkpoints. Defaults to 60.
+    resume : bool, optional
+        Whether to resume the run from the checkpoint_file, if it exists.
 
     Returns
     -------
     sampler : dynesty.DynamicNestedSampler
     """
-    if save_dir is not None:
-        checkpoint_file = save_dir / "sampler.save"
-    else:
-        checkpoint_file = None
+    checkpoint_file = kwargs.pop("checkpoint_file", None)
+    if checkpoint_file is None and save_dir is not None:
+        checkpoint_file = Path(save_dir) / "sampler.save"
+
+    resume = kwargs.pop("resume", False)
+    resume = resume and checkpoint_file is not None and Path(checkpoint_file).exists()
 
     components = OPTIONS.model.components
     periodic = [index for index, param in enumerate(get_fit_params(components)) if param.periodic]
@@ -589,8 +794,13 @@ def run_dynesty(
     reflective = [index for index, param in enumerate(get_fit_params(components)) if param.reflective]
     reflective = None if not reflective else reflective
 
-    pool = Pool(processes=ncores) if not debug else None
-    queue_size = 2 * ncores if not debug else None
+    pool = kwargs.pop("pool", None)
+    external_pool = pool is not None
+    pin_workers = kwargs.pop("pin_workers", False)
+    if pool is None and not debug:
+        pool = create_pool(ncores, pin_workers)
+
+    queue_size = kwargs.pop("queue_size", 2 * ncores if pool is not None else None)
 
     general_kwargs = {
         "bound": bound,
@@ -605,10 +815,12 @@ def run_dynesty(
         "nlive_batch": kwargs.pop("nlive_batch", 500),
         "dlogz_init": kwargs.pop("dlogz_init", 0.01),
         "nlive_init": kwargs.pop("nlive_init", 1000),
+        "wt_kwargs": kwargs.pop("wt_kwargs", None),
+        "checkpoint_every": kwargs.pop("checkpoint_every", 60),
     }
 
     print(f"Executing Dynesty.\n{'':-^50}")
-    labels = get_labels(OPTIONS.model.components)
+    labels = get_fit_labels()
     ptform = kwargs.pop("ptform", None)
     if ptform is None:
         if OPTIONS.fit.condition == "one_disc":
@@ -618,28 +830,65 @@ def run_dynesty(
         else:
             ptform = transform_uniform_prior
 
-    sampler = DynamicNestedSampler(
-        kwargs.pop("lnprob", lnprob),
-        ptform,
-        len(labels),
-        **general_kwargs,
-    )
+    if resume:
+        # NOTE: The restored sampler continues from its last checkpoint
+        sampler = DynamicNestedSampler.restore(str(checkpoint_file), pool=pool)
+    else:
+        sampler = DynamicNestedSampler(
+            kwargs.pop("lnprob", lnprob),
+            ptform,
+            len(labels),
+            **general_kwargs,
+        )
+
     sampler.run_nested(
-        **run_kwargs, print_progress=True, checkpoint_file=str(checkpoint_file)
+        **run_kwargs,
+        print_progress=True,
+        resume=resume,
+        checkpoint_file=None if checkpoint_file is None else str(checkpoint_file),
     )
 
-    if not debug:
+    if pool is not None and not external_pool:
         pool.close()
         pool.join()
 
     return sampler
 
 
+def set_fit_cache() -> None:
+    """Caches the priors, labels, data and working components of the fit."""
+    priors = get_priors(OPTIONS.model.components)
+    priors.flags.writeable = False
+    OPTIONS.fit.priors = priors
+    OPTIONS.fit.labels = tuple(get_labels(OPTIONS.model.components))
+
+    data_cache = {}
+    for key in set(OPTIONS.fit.data) | {"flux"}:
+        data_cache[key] = get_fit_data(key)
+        for array in data_cache[key]:
+            array.flags.writeable = False
+    OPTIONS.fit.data_cache = data_cache
+
+    components = [component.copy() for component in OPTIONS.model.components]
+    OPTIONS.fit.theta_params = get_theta_params(components)
+    OPTIONS.fit.components = components
+
+
+def clear_fit_cache() -> None:
+    """Clears the cache of the fit."""
+    OPTIONS.fit.priors = OPTIONS.fit.labels = OPTIONS.fit.data_cache = None
+    OPTIONS.fit.components = OPTIONS.fit.theta_params = None
+
+
 def run_fit(**kwargs):
     """Runs the fit."""
-    if OPTIONS.fit.fitter == "emcee":
-        return run_emcee(**kwargs)
-    return run_dynesty(**kwargs)
+    set_fit_cache()
+    try:
+        if OPTIONS.fit.fitter == "emcee":
+            return run_emcee(**kwargs)
+        return run_dynesty(**kwargs)
+    finally:
+        clear_fit_cache()
 
 
 def get_best_fit(
@@ -678,6 +927,6 @@ def get_best_fit(
             quantiles[1] = samples[
                 np.argmax(sampler.get_log_prob(discard=discard, flat=True))
             ]
-        params, uncertainties = quantiles[1], np.diff(quantiles, axis=0)
+        params, uncertainties = quantiles[1], np.diff(quantiles, axis=0).T
 
     return params, uncertainties
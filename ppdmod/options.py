@@ -1,45 +1,65 @@
+from functools import lru_cache
 from pathlib import Path
-from types import SimpleNamespace
-from typing import Any, Dict, List
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 
 import astropy.units as u
-import matplotlib.pyplot as plt
 import numpy as np
 import toml
-from matplotlib import colormaps as mcm
-from matplotlib.colors import ListedColormap
 
+# NOTE: Matplotlib is only imported when a colormap is requested, as it is
+# only needed for plotting
+if TYPE_CHECKING:
+    from matplotlib.colors import ListedColormap
 
-def convert_style_to_colormap(style: str) -> ListedColormap:
+
+@lru_cache(maxsize=None)
+def convert_style_to_colormap(style: str) -> "ListedColormap":
     """Converts a style into a colormap."""
+    import matplotlib.pyplot as plt
+    from matplotlib.colors import ListedColormap
+
     plt.style.use(style)
     colormap = ListedColormap(plt.rcParams["axes.prop_cycle"].by_key()["color"])
     plt.style.use("default")
     return colormap
 
 
-def get_colormap(colormap: str) -> ListedColormap:
+@lru_cache(maxsize=None)
+def get_colormap(colormap: str) -> "ListedColormap":
     """Gets the colormap as the matplotlib colormaps or styles."""
+    from matplotlib import colormaps as mcm
+
     try:
         return mcm.get_cmap(colormap)
     except ValueError:
         return convert_style_to_colormap(colormap)
 
 
-def get_colorlist(colormap: str, ncolors: int = 10) -> List[str]:
-    """Gets the colormap as a list from the matplotlib colormaps."""
-    return [get_colormap(colormap)(i) for i in range(ncolors)]
+@lru_cache(maxsize=None)
+def get_colorlist(colormap: str, ncolors: int = 10) -> Tuple[Tuple[float, ...], ...]:
+    """Gets the colormap as a (cached) tuple from the matplotlib colormaps."""
+    colormap = get_colormap(colormap)
+    return tuple(colormap(i) for i in range(ncolors))
+
+
+class ColorOptions(SimpleNamespace):
+    """The color options with the color list computed on access."""
+
+    @property
+    def list(self) -> List[str]:
+        return list(get_colorlist(self.colormap, self.number))
 
 
 def get_units(dictionary: Dict[str, Any]) -> Dict[str, Any]:
     """Converts the units in a dictionary to astropy units."""
+    units = {"one": u.one}
     converted_dictionary = dictionary.copy()
     for value in converted_dictionary.values():
         if "unit" in value:
-            if value["unit"] == "one":
-                value["unit"] = u.one
-            else:
-                value["unit"] = u.Unit(value["unit"])
+            if value["unit"] not in units:
+                units[value["unit"]] = u.Unit(value["unit"])
+            value["unit"] = units[value["unit"]]
 
     return converted_dictionary
 
@@ -49,7 +69,9 @@ def load_toml_to_namespace(toml_file: Path):
     with open(toml_file, "r") as file:
         data = toml.load(file)["STANDARD_PARAMETERS"]
 
-    return SimpleNamespace(**get_units(data))
+    return SimpleNamespace(
+        **{key: MappingProxyType(value) for key, value in get_units(data).items()}
+    )
 
 
 STANDARD_PARAMS = load_toml_to_namespace(
@@ -117,9 +139,7 @@ model = SimpleNamespace(
 )
 
 # NOTE: Plot
-color = SimpleNamespace(
-    background="white", colormap="plasma", number=100, list=get_colorlist("plasma", 100)
-)
+color = ColorOptions(background="white", colormap="plasma", number=100)
 errorbar = SimpleNamespace(
     color=None,
     markeredgecolor="black",
@@ -151,6 +171,11 @@ fit = SimpleNamespace(
     fitter="dynesty",
     condition=None,
     condition_indices=None,
+    priors=None,
+    labels=None,
+    data_cache=None,
+    components=None,
+    theta_params=None,
 )
 
 # NOTE: All options
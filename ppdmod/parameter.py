@@ -1,13 +1,37 @@
 from dataclasses import dataclass
-from typing import Any, List
+from functools import lru_cache
+from itertools import count
+from typing import Any, List, Tuple
 
 import astropy.units as u
 import numpy as np
 from numpy.typing import ArrayLike
 
-from .options import STANDARD_PARAMS
+from .options import OPTIONS, STANDARD_PARAMS
 from .utils import smooth_interpolation
 
+# NOTE: Gives every (re)assignment of a parameter's attributes a unique state
+STATE_COUNTER = count()
+
+FLAGS = ("free", "shared", "smooth", "reflective", "periodic")
+
+
+@lru_cache(maxsize=None)
+def get_base(base: str) -> Tuple[Tuple[Tuple[str, Any], ...], Tuple[str, ...]]:
+    """Gets the items of a standard parameter and the flags it does not set."""
+    base_param = getattr(STANDARD_PARAMS, base)
+    return tuple(base_param.items()), tuple(key for key in FLAGS if key not in base_param)
+
+
+def get_smooth_options() -> Tuple[Any, ...]:
+    """Gets the options the smooth interpolation depends on."""
+    interpolation = OPTIONS.data.interpolation
+    windows = tuple(
+        (band, tuple(np.atleast_1d(window.value).tolist()))
+        for band, window in vars(OPTIONS.data.binning).items()
+    )
+    return interpolation.dim, interpolation.kind, interpolation.fill_value, windows
+
 
 @dataclass()
 class Parameter:
@@ -33,26 +57,27 @@ class Parameter:
         if base is None:
             return
 
-        base_param = getattr(STANDARD_PARAMS, base)
-        for key, value in base_param.items():
-            if getattr(self, key) is None:
-                setattr(self, key, value)
+        items, flags = get_base(base)
+        attributes = self.__dict__
+        for key, value in items:
+            if attributes.get(key) is None:
+                attributes[key] = value
 
-        for key in ["free", "shared", "smooth", "reflective", "periodic"]:
-            if key not in base_param:
-                if getattr(self, key) is not None:
-                    continue
-
-                setattr(self, key, False)
+        for key in flags:
+            if attributes.get(key) is None:
+                attributes[key] = False
 
     def _set_to_numpy_array(self, array: ArrayLike | None = None) -> Any | np.ndarray:
-        """Converts a value to a numpy array."""
+        """Converts a value to a (contiguous) numpy array."""
         if array is None:
             return
 
         if isinstance(array, (tuple, list)):
             return np.array(array)
 
+        if isinstance(array, np.ndarray) and not array.flags.c_contiguous:
+            return array.copy(order="C")
+
         return array
 
     def __setattr__(self, key: str, value: Any):
@@ -60,8 +85,36 @@ class Parameter:
         if key != "unit":
             if isinstance(value, u.Quantity):
                 value = value.value
+
+        # NOTE: Reassigning an equal scalar (e.g., a fixed value of theta) keeps the state
+        current = self.__dict__.get(key)
+        if np.isscalar(value) and np.isscalar(current) and value == current:
+            super().__setattr__(key, value)
+            return
+
+        # NOTE: Any change of the interpolated data invalidates the cached interpolation
+        if key in ["value", "grid", "smooth"]:
+            super().__setattr__("_interp_cache", None)
+        if not key.startswith("_"):
+            super().__setattr__("_state", next(STATE_COUNTER))
+            super().__setattr__("_quantity_cache", None)
         super().__setattr__(key, value)
 
+    def __getstate__(self) -> dict:
+        """Gets the state for pickling and copying without the caches."""
+        return {
+            key: value
+            for key, value in self.__dict__.items()
+            if key != "_state" and not key.endswith("_cache")
+        }
+
+    def __setstate__(self, state: dict) -> None:
+        """Sets the state and gives it a new state in this process."""
+        self.__dict__.update(state)
+        self.__dict__.update(
+            _interp_cache=None, _quantity_cache=None, _state=next(STATE_COUNTER)
+        )
+
     def __str__(self):
         message = (
             f"Parameter: {self.name} has the value "
@@ -80,21 +133,75 @@ class Parameter:
         self.grid = self._set_to_numpy_array(self.grid)
         self._process_base(self.base)
 
-    def __call__(self, points: u.Quantity | None = None) -> np.ndarray:
+    def __call__(
+        self, points: u.Quantity | None = None, raw: bool = False
+    ) -> u.Quantity | np.ndarray:
         """Gets the value for the parameter or the corresponding
-        values for some points."""
+        values for some points.
+
+        Parameters
+        ----------
+        points : astropy.units.Quantity, optional
+            The points to interpolate the value onto.
+        raw : bool, optional
+            If True, returns the value without its unit.
+        """
         if self.value is None:
             return None
 
         if points is None or self.grid is None:
-            value = self.value
+            if self._quantity_cache is None:
+                quantity = u.Quantity(self.value, unit=self.unit, dtype=self.dtype)
+                quantity.flags.writeable = False
+                # NOTE: Set directly, as __setattr__ would strip the unit
+                super().__setattr__("_quantity_cache", quantity)
+            return self._quantity_cache.value if raw else self._quantity_cache
+
+        if raw:
+            return self.raw_call(points.value)
+        value = self._interpolate(points.value)
+        return u.Quantity(value, unit=self.unit, dtype=self.dtype)
+
+    def raw_call(self, points: np.ndarray | None = None) -> np.ndarray:
+        """Gets the value for the parameter or the corresponding
+        values for some points without any units.
+
+        Parameters
+        ----------
+        points : numpy.ndarray, optional
+            The points to interpolate the value onto (in the grid's unit).
+        """
+        if self.value is None:
+            return None
+
+        if points is None or self.grid is None:
+            return np.asarray(self(raw=True))
+
+        return np.asarray(self._interpolate(points), dtype=self.dtype)
+
+    def _interpolate(self, points: np.ndarray) -> np.ndarray:
+        """Interpolates the value onto the points."""
+        # NOTE: Reuses the last result, as mostly the same (fit) wavelengths are used
+        options = get_smooth_options() if self.smooth else None
+        if self._interp_cache is not None:
+            cached_points, cached_options, cached_value = self._interp_cache
+            if (
+                cached_options == options
+                and cached_points.shape == points.shape
+                and np.array_equal(cached_points, points)
+            ):
+                return cached_value
+
+        if self.smooth:
+            value = smooth_interpolation(points, self.grid, self.value)
         else:
-            if self.smooth:
-                value = smooth_interpolation(points.value, self.grid, self.value)
-            else:
-                value = np.interp(points.value, self.grid, self.value)
+            value = np.interp(points, self.grid, self.value)
 
-        return u.Quantity(value, unit=self.unit, dtype=self.dtype)
+        # NOTE: The cached value is returned as is, so it is made read-only
+        value = np.asarray(value)
+        value.flags.writeable = False
+        self._interp_cache = (np.array(points, copy=True), options, value)
+        return value
 
     def copy(self) -> "Parameter":
         """Copies the parameter."""
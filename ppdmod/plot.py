@@ -14,12 +14,14 @@ import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
 import numpy as np
 from astropy.io import fits
-from astropy.wcs import WCS
 from dynesty import DynamicNestedSampler, NestedSampler
 from dynesty import plotting as dyplot
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
 from matplotlib.gridspec import GridSpec
 from matplotlib.legend import Legend
+from scipy.integrate import cumulative_trapezoid
 
 from .component import FourierComponent
 from .fitting import compute_observables, get_best_fit
@@ -61,6 +63,19 @@ def set_legend_color(legend: Legend, background_color: str) -> None:
     legend.get_frame().set_facecolor(background_color)
 
 
+def compute_images(
+    components: List[FourierComponent],
+    dim: int,
+    pixel_size: u.mas,
+    wavelength: u.um,
+) -> np.ndarray:
+    """Computes the summed image of the components for the wavelengths."""
+    image = np.zeros((np.size(wavelength), dim, dim), dtype=OPTIONS.data.dtype.real)
+    for component in components:
+        image += component.compute_image(dim, pixel_size, wavelength)
+    return image
+
+
 def plot_components(
     components: List[FourierComponent],
     dim: int,
@@ -73,12 +88,16 @@ def plot_components(
     cmap: str = "inferno",
     no_text: bool = False,
     savefig: Path | None = None,
+    image: np.ndarray | None = None,
 ) -> Tuple[Axes]:
-    """Plots a component."""
+    """Plots a component.
+
+    If a precomputed image (of shape (dim, dim)) is passed, it is used
+    instead of computing the image of the components at the wavelength.
+    """
     components = [components] if not isinstance(components, list) else components
-    image = sum(
-        [comp.compute_image(dim, pixel_size, wavelength) for comp in components]
-    )[0]
+    if image is None:
+        image = compute_images(components, dim, pixel_size, wavelength)[0]
 
     if any(hasattr(component, "dist") for component in components):
         dist = [component for component in components if hasattr(component, "dist")][
@@ -88,12 +107,21 @@ def plot_components(
 
     extent = u.Quantity([sign * dim * pixel_size / 2 for sign in [-1, 1, 1, -1]])
     if save_as_fits:
-        wcs = WCS(naxis=2)
-        wcs.wcs.crpix = (dim / 2, dim / 2)
-        wcs.wcs.cdelt = (pixel_size * u.mas.to(u.rad), pixel_size * u.mas.to(u.rad))
-        wcs.wcs.crval = (0.0, 0.0)
-        wcs.wcs.cunit = (u.rad, u.rad)
-        hdu = fits.HDUList([fits.PrimaryHDU(image, header=wcs.to_header())])
+        # NOTE: The WCS is a plain linear two axis grid, so its keywords are
+        # written directly instead of going through astropy.wcs
+        header = fits.Header()
+        header["WCSAXES"] = (2, "Number of coordinate axes")
+        for axis in [1, 2]:
+            header[f"CRPIX{axis}"] = (dim / 2, "Pixel coordinate of reference point")
+            header[f"CDELT{axis}"] = (
+                pixel_size * u.mas.to(u.rad),
+                "[rad] Coordinate increment at reference point",
+            )
+            header[f"CUNIT{axis}"] = ("rad", "Units of coordinate increment and value")
+            header[f"CRVAL{axis}"] = (0.0, "[rad] Coordinate value at reference point")
+        # NOTE: Single precision is enough for the image and halves the file size
+        image = np.asarray(image, dtype=np.float32)
+        hdu = fits.HDUList([fits.PrimaryHDU(image, header=header)])
         hdu.writeto(savefig, overwrite=True)
     else:
         if ax is None:
@@ -177,9 +205,11 @@ def plot_component_mosaic(
         facecolor=OPTIONS.plot.color.background,
     )
 
-    images = []
+    # NOTE: The images for all wavelengths are computed at once
+    components = [components] if not isinstance(components, list) else components
+    images = compute_images(components, dim, pixel_size, wavelengths)
     for index, (ax, wavelength) in enumerate(zip(axes.flatten(), wavelengths.value)):
-        _, top_ax, right_ax, image = plot_components(
+        _, top_ax, right_ax, _ = plot_components(
             components,
             dim,
             pixel_size,
@@ -189,6 +219,7 @@ def plot_component_mosaic(
             zoom=zoom,
             ax=ax,
             cmap=cmap,
+            image=images[index],
         )
 
         # set_axes_color(ax, "black", set_label=False, direction="in")
@@ -202,8 +233,6 @@ def plot_component_mosaic(
         # if rows:
         # ax.tick_params(labelbottom=False)
 
-        images.append(image)
-
         ax.text(
             0.18,
             0.95,
@@ -214,8 +243,6 @@ def plot_component_mosaic(
             ha="center",
         )
 
-    images = np.array(images)
-
     [fig.delaxes(ax) for ax in axes.flatten()[num_plots:]]
 
     plt.tight_layout()
@@ -374,6 +401,8 @@ def plot_corner(
     units: List[str] | None = None,
     fontsize: int = 12,
     discard: int = 0,
+    thin: int = 1,
+    max_points: int | None = None,
     savefig: Path | None = None,
     **kwargs,
 ) -> None:
@@ -386,6 +415,12 @@ def plot_corner(
         The parameter labels.
     units : list of str, optional
     discard : int, optional
+    thin : int, optional
+        Only takes every thin-th step of the (emcee) chains. The default is 1.
+    max_points : int, optional
+        The maximum number of (emcee) samples plotted. If there are more, they
+        are randomly subsampled and the individual points are not drawn.
+        The default is None.
     fontsize : int, optional
         The fontsize. The default is 12.
     savefig : pathlib.Path, optional
@@ -434,8 +469,15 @@ def plot_corner(
                             fontsize=fontsize - 2,
                         )
     else:
-        samples = sampler.get_chain(discard=discard, flat=True)
-        corner.corner(samples, labels=labels)
+        samples = sampler.get_chain(discard=discard, thin=thin, flat=True)
+        plot_datapoints = True
+        if max_points is not None and samples.shape[0] > max_points:
+            indices = np.random.default_rng(0).choice(
+                samples.shape[0], max_points, replace=False
+            )
+            samples, plot_datapoints = samples[indices], False
+
+        corner.corner(samples, labels=labels, plot_datapoints=plot_datapoints)
 
     if savefig is not None:
         plt.savefig(savefig, format=Path(savefig).suffix[1:], dpi=OPTIONS.plot.dpi)
@@ -443,39 +485,54 @@ def plot_corner(
 
 
 def plot_chains(
-    sampler: NestedSampler | DynamicNestedSampler,
+    sampler,
     labels: List[str],
     units: List[str] | None = None,
     savefig: Path | None = None,
+    discard: int = 0,
     **kwargs,
 ) -> None:
     """Plots the fitter's chains.
 
     Parameters
     ----------
-    sampler : dynesty.NestedSampler or dynesty.DynamicNestedSampler
+    sampler : dynesty.NestedSampler or emcee.EnsembleSampler
         The sampler.
     labels : list of str
         The parameter labels.
     units : list of str, optional
-    discard : int, optional
     savefig : pathlib.Path, optional
         The save path. The default is None.
+    discard : int, optional
+        The steps discarded from the (emcee) chains. The default is 0.
     """
     labels = format_labels(labels, units)
     quantiles = [x / 100 for x in OPTIONS.fit.quantiles]
-    results = sampler.results
-    dyplot.traceplot(
-        results,
-        labels=labels,
-        truths=np.zeros(len(labels)),
-        quantiles=quantiles,
-        truth_color="black",
-        show_titles=True,
-        trace_cmap="viridis",
-        connect=True,
-        connect_highlight=range(5),
-    )
+    if OPTIONS.fit.fitter == "dynesty":
+        results = sampler.results
+        dyplot.traceplot(
+            results,
+            labels=labels,
+            truths=np.zeros(len(labels)),
+            quantiles=quantiles,
+            truth_color="black",
+            show_titles=True,
+            trace_cmap="viridis",
+            connect=True,
+            connect_highlight=range(5),
+        )
+    else:
+        samples = sampler.get_chain(discard=discard)
+        nsteps, nwalkers, ndim = samples.shape
+        _, axes = plt.subplots(ndim, figsize=(10, 2 * ndim), sharex=True, squeeze=False)
+        steps = np.broadcast_to(np.arange(nsteps), (nwalkers, nsteps))
+        for index, ax in enumerate(axes[:, 0]):
+            segments = np.stack([steps, samples[:, :, index].T], axis=-1)
+            ax.add_collection(LineCollection(segments, colors="k", alpha=0.3))
+            ax.set_xlim(0, max(nsteps - 1, 1))
+            ax.set_ylim(samples[:, :, index].min(), samples[:, :, index].max())
+            ax.set_ylabel(labels[index])
+        axes[-1, 0].set_xlabel("Step")
 
     if savefig:
         plt.savefig(savefig, format=Path(savefig).suffix[1:], dpi=OPTIONS.plot.dpi)
@@ -584,7 +641,9 @@ def plot_data_vs_model(
             np.any([wavelength_to_bands == band for band in bands], axis=0)
         )
 
-    band_wl = wavelengths[band_indices]
+    # NOTE: The grid is computed on raw floats (m / um = Mlambda), so that the
+    # per wavelength indexing does not create quantities
+    band_wl = wavelengths[band_indices].to_value(u.um)
     band_value, band_err = value[band_indices], err[band_indices]
     if model_data is not None:
         band_model_data = np.ma.masked_array(
@@ -592,13 +651,13 @@ def plot_data_vs_model(
         )
 
     set_axes_color(upper_ax, OPTIONS.plot.color.background)
-    color = colormap(norm(band_wl.value))
+    color = colormap(norm(band_wl))
     if baselines is None:
-        grid = [wl.repeat(band_value.shape[-1]) for wl in band_wl.value]
+        grid = np.broadcast_to(band_wl[:, np.newaxis], band_value.shape)
     else:
-        grid = (baselines / band_wl.value[:, np.newaxis])[:, 1:]
+        grid = (u.Quantity(baselines, u.m).value / band_wl[:, np.newaxis])[:, 1:]
 
-    for index, _ in enumerate(band_wl.value):
+    for index, _ in enumerate(band_wl):
         errorbar_params.color = scatter_params.color = color[index]
         upper_ax.errorbar(
             grid[index],
@@ -610,13 +669,6 @@ def plot_data_vs_model(
         )
 
         if model_data is not None and lower_ax is not None:
-            upper_ax.scatter(
-                grid[index],
-                band_model_data[index],
-                marker="X",
-                **vars(scatter_params),
-            )
-
             if key == "t3":
                 residuals = compare_angles(band_value[index], band_model_data[index])
             else:
@@ -629,17 +681,28 @@ def plot_data_vs_model(
                 fmt="o",
                 **vars(errorbar_params),
             )
-            lower_ax.axhline(y=0, color=hline_color, linestyle="--")
+
+    # NOTE: The model is drawn as a single scatter with a color per point
+    if model_data is not None and lower_ax is not None:
+        scatter_params.color = np.repeat(color, grid.shape[1], axis=0)
+        upper_ax.scatter(
+            grid.ravel(),
+            band_model_data.ravel(),
+            marker="X",
+            **vars(scatter_params),
+        )
+        lower_ax.axhline(y=0, color=hline_color, linestyle="--")
 
     if key in ["flux", "vis"]:
         ylim = ylims.get(key, [0, None])
     elif key == "vis2":
         ylim = ylims.get(key, [0, 1])
+    elif "t3" in ylims:
+        ylim = ylims["t3"]
     else:
         value = OPTIONS.data.t3.value
-        lower_bound = np.ma.min(value) + np.ma.min(value) * 0.25
-        upper_bound = np.ma.max(value) + np.ma.max(value) * 0.25
-        ylim = ylims.get("t3", [lower_bound, upper_bound])
+        lower_bound, upper_bound = np.ma.min(value), np.ma.max(value)
+        ylim = [lower_bound * 1.25, upper_bound * 1.25]
 
     upper_ax.set_ylim(ylim)
 
@@ -671,6 +734,7 @@ def plot_fit(
     bands: List[str] | str = "all",
     title: str | None = None,
     savefig: Path | None = None,
+    fig: Figure | None = None,
 ):
     """Plots the deviation of a model from real data of an object for
     total flux, visibilities and closure phases.
@@ -693,6 +757,9 @@ def plot_fit(
         The title. The default is None.
     savefig : pathlib.Path, optional
         The save path. The default is None.
+    fig : matplotlib.figure.Figure, optional
+        A figure to be cleared and reused (e.g., for repeated calls during
+        a fit). It is neither shown nor closed. The default is None.
     """
     data_to_plot = OPTIONS.fit.data if data_to_plot is None else data_to_plot
     flux, t3 = OPTIONS.data.flux, OPTIONS.data.t3
@@ -714,8 +781,13 @@ def plot_fit(
     model_flux, model_vis, model_t3 = compute_observables(components)
     pos_angle, inclination = components[0].pa(), components[0].cinc()
 
-    figsize = (16, 5) if nplots == 3 else ((12, 5) if nplots == 2 else None)
-    fig = plt.figure(figsize=figsize, facecolor=OPTIONS.plot.color.background)
+    reuse_fig = fig is not None
+    if reuse_fig:
+        fig.clf()
+        fig.set_facecolor(OPTIONS.plot.color.background)
+    else:
+        figsize = (16, 5) if nplots == 3 else ((12, 5) if nplots == 2 else None)
+        fig = plt.figure(figsize=figsize, facecolor=OPTIONS.plot.color.background)
     gs = GridSpec(2, nplots, height_ratios=[3, 1])
     axarr = {
         key: value
@@ -785,7 +857,7 @@ def plot_fit(
 
     sm = cm.ScalarMappable(cmap=get_colormap(cmap), norm=norm)
     sm.set_array([])
-    cbar = plt.colorbar(sm, ax=axarr[data_types[-1]])
+    cbar = fig.colorbar(sm, ax=axarr[data_types[-1]])
     cbar.set_ticks(OPTIONS.plot.ticks)
     cbar.set_ticklabels([f"{wavelength:.1f}" for wavelength in OPTIONS.plot.ticks])
 
@@ -798,13 +870,15 @@ def plot_fit(
     cbar.set_label(label=r"$\lambda$ ($\mathrm{\mu}$m)", color=opposite_color)
 
     if title is not None:
-        plt.title(title)
+        fig.gca().set_title(title)
 
     if savefig is not None:
-        plt.savefig(savefig, format=Path(savefig).suffix[1:], dpi=OPTIONS.plot.dpi)
-    else:
+        fig.savefig(savefig, format=Path(savefig).suffix[1:], dpi=OPTIONS.plot.dpi)
+    elif not reuse_fig:
         plt.show()
-    plt.close()
+
+    if not reuse_fig:
+        plt.close(fig)
 
 
 def plot_overview(
@@ -817,6 +891,7 @@ def plot_overview(
     pos_angle: float | None = None,
     bands: List[str] | str = "all",
     savefig: Path | None = None,
+    fig: Figure | None = None,
 ) -> None:
     """Plots an overview over the total data for baselines [Mlambda].
 
@@ -826,6 +901,9 @@ def plot_overview(
         The data to plot. The default is OPTIONS.fit.data.
     savefig : pathlib.Path, optional
         The save path. The default is None.
+    fig : matplotlib.figure.Figure, optional
+        A figure to be cleared and reused (e.g., for repeated calls during
+        a fit). It is neither shown nor closed. The default is None.
     """
     data_to_plot = OPTIONS.fit.data if data_to_plot is None else data_to_plot
     wavelengths = OPTIONS.fit.wavelengths
@@ -839,14 +917,21 @@ def plot_overview(
             data_types.append(key)
         nplots += 1
 
-    figsize = (15, 5) if nplots == 3 else ((12, 5) if nplots == 2 else None)
-    fig, axarr = plt.subplots(
-        1,
-        nplots,
-        figsize=figsize,
-        tight_layout=True,
-        facecolor=OPTIONS.plot.color.background,
-    )
+    reuse_fig = fig is not None
+    if reuse_fig:
+        fig.clf()
+        fig.set_facecolor(OPTIONS.plot.color.background)
+        fig.set_layout_engine("tight")
+        axarr = fig.subplots(1, nplots)
+    else:
+        figsize = (15, 5) if nplots == 3 else ((12, 5) if nplots == 2 else None)
+        fig, axarr = plt.subplots(
+            1,
+            nplots,
+            figsize=figsize,
+            tight_layout=True,
+            facecolor=OPTIONS.plot.color.background,
+        )
     axarr = axarr.flatten() if isinstance(axarr, np.ndarray) else [axarr]
     axarr = dict(zip(data_types, axarr))
 
@@ -908,7 +993,7 @@ def plot_overview(
 
     sm = cm.ScalarMappable(cmap=colormap, norm=norm)
     sm.set_array([])
-    cbar = plt.colorbar(sm, ax=axarr[data_types[-1]])
+    cbar = fig.colorbar(sm, ax=axarr[data_types[-1]])
 
     # TODO: Set the ticks, but make it so that it is flexible for the band
     cbar.set_ticks(OPTIONS.plot.ticks)
@@ -923,16 +1008,18 @@ def plot_overview(
     cbar.set_label(label=r"$\lambda$ ($\mathrm{\mu}$m)", color=opposite_color)
 
     if title is not None:
-        plt.title(title)
+        fig.gca().set_title(title)
 
     if raxis:
         return fig, axarr
 
     if savefig is not None:
-        plt.savefig(savefig, format=Path(savefig).suffix[1:], dpi=OPTIONS.plot.dpi)
-    else:
+        fig.savefig(savefig, format=Path(savefig).suffix[1:], dpi=OPTIONS.plot.dpi)
+    elif not reuse_fig:
         plt.show()
-    plt.close()
+
+    if not reuse_fig:
+        plt.close(fig)
 
 
 # TODO: Make colorscale permanent -> Implement colormap
@@ -1296,12 +1383,6 @@ def plot_intermediate_products(
         )
         intensity.append(component.compute_intensity(radius, wavelength[:, np.newaxis]))
 
-    temperature = u.Quantity(temperature)
-    surface_density = u.Quantity(surface_density)
-    optical_depth = u.Quantity(optical_depth)
-    emissivity = u.Quantity(emissivity)
-    intensity = u.Quantity(intensity)
-
     total_flux = sum(fluxes)
     ax.plot(wavelengths, total_flux, label="Total")
     ax.set_yscale("log")
@@ -1332,74 +1413,36 @@ def plot_intermediate_products(
     fill_radii = [np.linspace(lower, upper, dim) for lower, upper in radii_bounds]
     merged_radii = list(chain.from_iterable(zip_longest(radii, fill_radii)))[:-1]
     merged_radii = u.Quantity(np.concatenate(merged_radii, axis=0))
-    fill_zeros = np.zeros((len(fill_radii), wavelength.size, dim))
+    fill_zeros = np.zeros((wavelength.size, dim))
+
+    def merge_with_fill(products: List[u.Quantity], fill: u.Quantity) -> u.Quantity:
+        """Merges the products along the radius with the fill in between."""
+        fills = [fill] * len(fill_radii)
+        merged = list(chain.from_iterable(zip_longest(products, fills)))[:-1]
+        return np.concatenate(merged, axis=-1)
 
     # TODO: Make it so that the temperatures are somehow continous in the plot? (Maybe check for self.temps in the models?)
     # or interpolate smoothly somehow (see the one youtube video?) :D
-    temperature = u.Quantity(
-        list(chain.from_iterable(zip_longest(temperature, fill_zeros[:, 0, :] * u.K)))[
-            :-1
-        ]
-    )
-    temperature = np.concatenate(temperature, axis=0)
-    surface_density = u.Quantity(
-        list(
-            chain.from_iterable(
-                zip_longest(surface_density, fill_zeros[:, 0, :] * u.g / u.cm**2)
-            )
-        )[:-1]
-    )
-    surface_density = np.concatenate(surface_density, axis=0)
-    optical_depth = u.Quantity(
-        list(chain.from_iterable(zip_longest(optical_depth, fill_zeros)))[:-1]
+    temperature = merge_with_fill(temperature, fill_zeros[0] * u.K)
+    surface_density = merge_with_fill(surface_density, fill_zeros[0] * u.g / u.cm**2)
+    optical_depth = merge_with_fill(optical_depth, fill_zeros * u.one)
+    emissivity = merge_with_fill(emissivity, fill_zeros * u.one)
+    intensity = merge_with_fill(
+        intensity, fill_zeros * u.erg / u.cm**2 / u.s / u.Hz / u.sr
     )
-    optical_depth = np.hstack(optical_depth)
-    emissivity = u.Quantity(
-        list(chain.from_iterable(zip_longest(emissivity, fill_zeros)))[:-1]
-    )
-    emissivity = np.hstack(emissivity)
-    intensity = u.Quantity(
-        list(
-            chain.from_iterable(
-                zip_longest(intensity, fill_zeros * u.erg / u.cm**2 / u.s / u.Hz / u.sr)
-            )
-        )[:-1]
-    )
-    intensity = np.hstack(intensity)
     intensity = intensity.to(u.W / u.m**2 / u.Hz / u.sr)
     merged_radii_mas = distance_to_angular(merged_radii, components[-1].dist())
 
     # TODO: Code this in a better manner
     wls = [1.7, 2.15, 3.4, 8, 11.3, 13] * u.um
-    cumulative_intensity = (
-        np.zeros((wls.size, merged_radii_mas.size))
-        * u.erg
-        / u.s
-        / u.Hz
-        / u.cm**2
-        / u.sr
+    # NOTE: The intensities are computed for all wavelengths at once
+    tmp_intensity = [
+        component.compute_intensity(radius, wls[:, np.newaxis])
+        for radius, component in zip(radii, components[1:])
+    ]
+    cumulative_intensity = merge_with_fill(
+        tmp_intensity, np.zeros((wls.size, dim)) * u.erg / u.cm**2 / u.s / u.Hz / u.sr
     )
-    for index, wl in enumerate(wls):
-        tmp_intensity = [
-            component.compute_intensity(radius, wl)
-            for radius, component in zip(radii, components[1:])
-        ]
-        tmp_intensity = u.Quantity(
-            list(
-                chain.from_iterable(
-                    zip_longest(
-                        tmp_intensity,
-                        fill_zeros[0, 0][np.newaxis, :]
-                        * u.erg
-                        / u.cm**2
-                        / u.s
-                        / u.Hz
-                        / u.sr,
-                    )
-                )
-            )[:-1]
-        )
-        cumulative_intensity[index, :] = np.hstack(tmp_intensity)
 
     cumulative_intensity = cumulative_intensity.to(
         u.erg / u.s / u.Hz / u.cm**2 / u.mas**2
@@ -1413,17 +1456,20 @@ def plot_intermediate_products(
         ]
     )
 
+    # NOTE: The flux up to (and excluding) each radius is integrated in a single pass
+    integrand = merged_radii_mas * cumulative_intensity
     cumulative_flux = np.zeros((wls.size, merged_radii.size)) * u.Jy
-    for index, _ in enumerate(merged_radii):
-        cumulative_flux[:, index] = (
-            2
-            * np.pi
-            * components[-1].cinc()
-            * np.trapz(
-                merged_radii_mas[:index] * cumulative_intensity[:, :index],
-                merged_radii_mas[:index],
-            ).to(u.Jy)
-        )
+    cumulative_flux[:, 1:] = (
+        2
+        * np.pi
+        * components[-1].cinc()
+        * u.Quantity(
+            cumulative_trapezoid(
+                integrand.value, merged_radii_mas.value, initial=0
+            )[:, :-1],
+            unit=integrand.unit * merged_radii_mas.unit,
+        ).to(u.Jy)
+    )
     cumulative_flux_ratio = cumulative_flux / cumulative_total_flux
     plot_product(
         merged_radii.value,
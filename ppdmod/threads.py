@@ -0,0 +1,23 @@
+import os
+
+# NOTE: This module does not import numpy, as the variables only take effect
+# if they are set before numpy (and its BLAS library) is first imported
+THREAD_VARIABLES = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def set_thread_limits(nthreads: int = 1) -> None:
+    """Sets the number of threads per worker, if not already set.
+
+    Parameters
+    ----------
+    nthreads : int, optional
+        The number of threads. The default is 1.
+    """
+    for variable in THREAD_VARIABLES:
+        os.environ.setdefault(variable, str(nthreads))
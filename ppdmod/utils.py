@@ -84,7 +84,7 @@ def compare_angles(angle1: u.Quantity, angle2: u.Quantity) -> complex:
 
 def windowed_linspace(start: float, end: float, window: float) -> np.ndarray:
     """Creates a numpy.linspace with a number of points so that the windowing doesn't overlap"""
-    return np.linspace(start, end, int((end - start) // (2 * window / 2)) + 1)
+    return np.linspace(start, end, int((end - start) // window) + 1)
 
 
 def get_band_limits(band: str) -> Tuple[float, float]:
@@ -147,9 +147,10 @@ def smooth_interpolation(
     )
     points = interpolation_points.flatten()
     windows = get_binning_windows(points).value
-    interpolation_grid = (
-        np.linspace(-1, 1, OPTIONS.data.interpolation.dim) * windows[:, np.newaxis] / 2
-    ).T + points
+    # NOTE: The grid is built as (dim, points) directly, as np.interp would
+    # otherwise copy the transposed (non-contiguous) array
+    offsets = np.linspace(-1, 1, OPTIONS.data.interpolation.dim)[:, np.newaxis]
+    interpolation_grid = offsets * (windows / 2) + points
     return (
         np.interp(interpolation_grid, grid, values)
         .mean(axis=0)
@@ -210,6 +211,36 @@ def get_indices(
     return indices
 
 
+# NOTE: Planck's law in terms of the wavelength [um] and temperature [K]
+PLANCK_PREFACTOR = (2 * const.h * const.c / u.um**3).to_value(
+    u.erg / (u.cm**2 * u.s * u.Hz)
+)
+PLANCK_EXPONENT = (const.h * const.c / (const.k_B * u.um)).to_value(u.K)
+
+
+def compute_planck(temperature: np.ndarray, wavelength: np.ndarray) -> np.ndarray:
+    """Computes the spectral radiance of a blackbody (Planck's law).
+
+    Parameters
+    ----------
+    temperature : numpy.ndarray
+        The temperature [K].
+    wavelength : numpy.ndarray
+        The wavelength [um].
+
+    Returns
+    -------
+    spectral_radiance : numpy.ndarray
+        The spectral radiance [erg/(cm2 s Hz sr)].
+    """
+    with np.errstate(over="ignore", divide="ignore"):
+        return (
+            PLANCK_PREFACTOR
+            / wavelength**3
+            / np.expm1(PLANCK_EXPONENT / (wavelength * temperature))
+        )
+
+
 def compute_photometric_slope(wavelengths: u.um, temperature: u.K) -> np.ndarray:
     """Computes the photometric slope of the data from
     the effective temperature of the star.
@@ -332,18 +363,19 @@ def compute_effective_baselines(
     baselines_angles : astropy.units.rad
         Returns the effective baseline angles.
     """
-    ucoord, vcoord = map(lambda x: u.Quantity(x, u.m), [ucoord, vcoord])
+    # NOTE: The computation is done on the raw arrays and the units are
+    # only attached to the results
+    ucoord, vcoord = map(lambda x: u.Quantity(x, u.m).value, [ucoord, vcoord])
     if pos_angle is not None:
-        pos_angle = u.Quantity(pos_angle, u.deg).to(u.rad)
-        inclination = u.Quantity(inclination, u.one)
-
-        ucoord_eff = ucoord * np.cos(pos_angle) - vcoord * np.sin(pos_angle)
-        vcoord_eff = ucoord * np.sin(pos_angle) + vcoord * np.cos(pos_angle)
+        pos_angle = u.Quantity(pos_angle, u.deg).to_value(u.rad)
+        cos_pa, sin_pa = np.cos(pos_angle), np.sin(pos_angle)
+        ucoord_eff = ucoord * cos_pa - vcoord * sin_pa
+        vcoord_eff = ucoord * sin_pa + vcoord * cos_pa
     else:
         ucoord_eff, vcoord_eff = ucoord, vcoord
 
     if inclination is not None:
-        ucoord_eff *= inclination
+        ucoord_eff *= u.Quantity(inclination, u.one).value
 
     baselines_eff = np.hypot(ucoord_eff, vcoord_eff)
     baseline_angles_eff = np.arctan2(vcoord_eff, ucoord_eff)
@@ -362,7 +394,7 @@ def compute_effective_baselines(
             baselines_eff = baselines_eff[1:]
             baseline_angles_eff = baseline_angles_eff[1:]
 
-    return baselines_eff.squeeze(), baseline_angles_eff.squeeze()
+    return baselines_eff.squeeze() * u.m, baseline_angles_eff.squeeze() * u.rad
 
 
 def binary(
@@ -747,7 +779,7 @@ def broadcast_baselines(
 
 def compute_vis(vis: np.ndarray) -> np.ndarray:
     """Computes the visibilities from the visibility function."""
-    return np.abs(vis).astype(OPTIONS.data.dtype.real)
+    return np.abs(vis).astype(OPTIONS.data.dtype.real, copy=False)
 
 
 def compute_t3(vis: np.ndarray) -> np.ndarray:
@@ -756,5 +788,6 @@ def compute_t3(vis: np.ndarray) -> np.ndarray:
         return np.array([])
 
     vis /= vis[:, :, 0][..., np.newaxis].real
-    bispectrum = vis[:, 0] * vis[:, 1] * vis[:, 2].conj()
-    return np.angle(bispectrum, deg=True).real
+    bispectrum = vis[:, 0] * vis[:, 1]
+    bispectrum *= np.conj(vis[:, 2])
+    return np.angle(bispectrum, deg=True)
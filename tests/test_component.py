@@ -1,7 +1,9 @@
+import pickle
 from pathlib import Path
 from typing import List
 
 import astropy.units as u
+import numpy as np
 import pytest
 
 from ppdmod.basic_components import Ring
@@ -100,6 +102,42 @@ def test_translate_coordinates(component: FourierComponent) -> None:
     assert component.translate_image_func(0, 0) == (-10 * u.mas, -10 * u.mas)
 
 
+def test_compute_complex_vis_cache(ring: Ring, wavelength: u.um) -> None:
+    """Tests that the complex visibilities are only reused for an unchanged state."""
+    ucoord, vcoord = np.array([[10.0, 50.0, 100.0]]), np.array([[20.0, -30.0, 60.0]])
+    vis = ring.compute_complex_vis(ucoord, vcoord, wavelength)
+    assert np.array_equal(ring.compute_complex_vis(ucoord, vcoord, wavelength), vis)
+
+    cache = ring._vis_cache
+    ring.rin.value = float(ring.rin.value)
+    ring.compute_complex_vis(ucoord, vcoord, wavelength)
+    assert ring._vis_cache is cache
+
+    ring.rin.value = 3
+    new_vis = ring.compute_complex_vis(ucoord, vcoord, wavelength)
+    assert not np.array_equal(new_vis, vis)
+    assert not np.array_equal(
+        ring.compute_complex_vis(ucoord * 2, vcoord, wavelength), new_vis
+    )
+
+
+def test_compute_complex_vis_cache_pickle(ring: Ring, wavelength: u.um) -> None:
+    """Tests that a pickled component does not reuse its cached visibilities."""
+    ucoord, vcoord = np.array([[10.0, 50.0, 100.0]]), np.array([[20.0, -30.0, 60.0]])
+    ring.compute_complex_vis(ucoord, vcoord, wavelength)
+
+    loaded = pickle.loads(pickle.dumps(ring))
+    assert loaded._vis_cache is None
+    assert loaded.rin._state != ring.rin._state
+
+    loaded.rin.value = 3
+    expected = Ring(dim=512, rin=3, width=1).compute_complex_vis(
+        ucoord, vcoord, wavelength
+    )
+    vis = loaded.compute_complex_vis(ucoord, vcoord, wavelength)
+    assert np.array_equal(vis, expected)
+
+
 def test_copy(component: FourierComponent) -> None: ...
 
 
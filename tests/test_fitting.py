@@ -5,17 +5,24 @@ import astropy.units as u
 import numpy as np
 import pytest
 
-from ppdmod.basic_components import AsymGreyBody, Star
+from ppdmod.basic_components import AsymGreyBody, Ring, Star
 from ppdmod.component import Component
 from ppdmod.data import set_data
 from ppdmod.fitting import (
+    compute_chi_sq,
     compute_interferometric_chi_sq,
     compute_observables,
+    get_fit_priors,
+    get_label_indices,
     get_labels,
     get_priors,
     get_theta,
+    get_theta_params,
+    lnprior,
     lnprob,
+    ptform_sequential_radii,
     set_components_from_theta,
+    transform_uniform_prior,
 )
 from ppdmod.options import OPTIONS
 from ppdmod.parameter import Parameter
@@ -150,6 +157,112 @@ def test_set_params_from_theta(
     OPTIONS.model.components = {}
 
 
+def test_get_label_indices() -> None:
+    """Tests the (cached) lookup of the label indices."""
+    labels = ("rin-1", "weight-1", "rin-2", "weight-2", "pa")
+    assert get_label_indices(labels, "weight") == (1, 3)
+    assert get_label_indices(labels, "rin") == (0, 2)
+    assert get_label_indices(labels, "sigma0") == ()
+
+
+@pytest.fixture
+def radii_components() -> List[Component]:
+    """Two rings with free radii."""
+    rin = Parameter(value=1, min=0.5, max=5, free=True, base="rin")
+    rout = Parameter(value=3, min=1, max=10, free=True, base="rout")
+    rin_outer = Parameter(value=4, min=1, max=15, free=True, base="rin")
+    return [Ring(rin=rin, rout=rout), Ring(rin=rin_outer)]
+
+
+def test_prior_transforms_batched(radii_components: List[Component]) -> None:
+    """Tests that the prior transforms work on batches of samples."""
+    OPTIONS.model.components = radii_components
+    OPTIONS.fit.condition_indices = [0, 1, 2]
+    thetas = np.random.default_rng(0).uniform(size=(20, 3))
+
+    params = transform_uniform_prior(thetas)
+    assert params.shape == thetas.shape
+    assert np.allclose(params, [transform_uniform_prior(theta) for theta in thetas])
+
+    params = ptform_sequential_radii(thetas)
+    assert params.shape == thetas.shape
+    assert np.allclose(params, [ptform_sequential_radii(theta) for theta in thetas])
+    assert np.all(np.diff(params, axis=1) >= 0)
+
+    OPTIONS.model.components = {}
+    OPTIONS.fit.condition_indices = None
+
+
+def test_get_fit_priors(radii_components: List[Component]) -> None:
+    """Tests that the cached priors of a fit are used if set."""
+    OPTIONS.model.components = radii_components
+    priors = get_priors(radii_components)
+    assert np.array_equal(get_fit_priors(), priors)
+
+    OPTIONS.fit.priors = priors * 2
+    assert np.array_equal(get_fit_priors(), priors * 2)
+
+    OPTIONS.model.components = {}
+    OPTIONS.fit.priors = None
+
+
+def test_lnprior(radii_components: List[Component]) -> None:
+    """Tests the vectorised prior check."""
+    OPTIONS.model.components = radii_components
+    assert lnprior(np.array([1, 3, 4])) == 0
+    assert np.isinf(lnprior(np.array([0.1, 3, 4])))
+    assert np.isinf(lnprior(np.array([1, 3, np.nan])))
+
+    OPTIONS.fit.condition = "sequential_radii"
+    OPTIONS.fit.condition_indices = [0, 1, 2]
+    assert np.isinf(lnprior(np.array([1, 5, 4])))
+
+    OPTIONS.model.components = {}
+    OPTIONS.fit.condition = OPTIONS.fit.condition_indices = None
+
+
+def test_set_components_from_theta_cached(
+    radii_components: List[Component],
+) -> None:
+    """Tests that the working components of a fit are updated in place."""
+    OPTIONS.model.components = radii_components
+    components = [component.copy() for component in radii_components]
+    OPTIONS.fit.theta_params = get_theta_params(components)
+    OPTIONS.fit.components = components
+
+    theta = np.array([2, 4, 6])
+    updated_components = set_components_from_theta(theta)
+    assert updated_components is components
+    assert components[0].rin().value == 2 and components[0].rout().value == 4
+    assert components[1].rin().value == 6
+    assert radii_components[0].rin().value == 1
+
+    with pytest.raises(ValueError):
+        set_components_from_theta(np.array([2, 4, 6, 8]))
+
+    OPTIONS.model.components = {}
+    OPTIONS.fit.components = OPTIONS.fit.theta_params = None
+
+
+def test_compute_chi_sq() -> None:
+    """Tests the linear and the logarithmic chi square."""
+    data, error = np.array([1.0, 2.0, 3.0]), np.array([0.5, 1.0, 2.0])
+    model_data = np.array([1.5, 1.0, 3.0])
+
+    chi_sq = compute_chi_sq(data, error, model_data, method="linear")
+    assert np.isclose(chi_sq, 2.0)
+
+    ln_chi_sq = compute_chi_sq(data, error, model_data, method="logarithmic")
+    expected = chi_sq + np.log(error**2).sum() + data.size**2 * np.log(2 * np.pi)
+    assert np.isclose(ln_chi_sq, -0.5 * expected)
+
+    data, model_data = np.array([170.0, -170.0, 10.0]), np.array([-170.0, 170.0, 0.0])
+    chi_sq = compute_chi_sq(
+        data, np.ones(3), model_data, diff_method="periodic", method="linear"
+    )
+    assert np.isclose(chi_sq, 900.0)
+
+
 # # TODO: Finish test.
 # # TODO: Test exponential chi_sq.
 # # @pytest.mark.parametrize(
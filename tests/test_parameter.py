@@ -3,6 +3,7 @@ import numpy as np
 import pytest
 from numpy.typing import ArrayLike
 
+from ppdmod.options import OPTIONS
 from ppdmod.parameter import Parameter
 
 VALUE = np.arange(0, 10) * u.mas
@@ -84,6 +85,53 @@ def test_multiple_wavelength_calling(x: Parameter) -> None:
     assert np.allclose(x(WAVELENGTH), VALUE)
 
 
+def test_interpolation_cache(x: Parameter) -> None:
+    """Tests that the interpolation is cached and reset on a new value."""
+    x.value, x.grid = VALUE, WAVELENGTH
+    assert np.allclose(x(WAVELENGTH), VALUE)
+    assert x._interp_cache is not None
+    assert not x.raw_call(WAVELENGTH.value).flags.writeable
+    assert np.allclose(x(WAVELENGTH), VALUE)
+
+    x.value = VALUE * 2
+    assert x._interp_cache is None
+    assert np.allclose(x(WAVELENGTH), VALUE * 2)
+    assert np.allclose(x(WAVELENGTH[:3]), VALUE[:3] * 2)
+
+
+def test_smooth_interpolation_cache(x: Parameter) -> None:
+    """Tests that the smooth interpolation is reset on new interpolation options."""
+    x.value, x.grid, x.smooth = VALUE ** 2, WAVELENGTH, True
+    wavelength = np.array([9.0, 10.5]) * u.um
+    value = x(wavelength)
+
+    OPTIONS.data.interpolation.dim = 20
+    assert not np.allclose(x(wavelength), value)
+    OPTIONS.data.interpolation.dim = 10
+    assert np.allclose(x(wavelength), value)
+
+
+def test_quantity_cache(x_filled: Parameter) -> None:
+    """Tests that the quantity is cached and reset on a new value."""
+    assert x_filled() is x_filled()
+    assert x_filled(raw=True) == 10
+    assert not isinstance(x_filled(raw=True), u.Quantity)
+
+    x_filled.value = 5
+    assert x_filled() == 5 * u.mas
+    x_filled.unit = u.deg
+    assert x_filled() == 5 * u.deg
+
+
+def test_raw_call(x: Parameter) -> None:
+    """Tests that the raw call matches the call without units."""
+    assert x.raw_call() == 0
+    x.value, x.grid = VALUE, WAVELENGTH
+    assert isinstance(x.raw_call(WAVELENGTH.value), np.ndarray)
+    assert np.allclose(x.raw_call(WAVELENGTH.value), x(WAVELENGTH).value)
+    assert np.allclose(x(WAVELENGTH[:3], raw=True), VALUE[:3].value)
+
+
 def test_process_base(x_filled: Parameter) -> None:
     """Tests the setting of a base class without overriding given values."""
     x_filled = Parameter(value=10, min=0, max=100, free=True, base="x")